@@ -3,6 +3,7 @@
 
 from web3 import Web3
 import os
+import httpx
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
@@ -23,28 +24,43 @@ tx_hash = "0x8b936be3da83ec2dd01e4576d933622e31095acaae56b60da064ff086dbe553f"
 print(f"\n🔍 Checking transaction: {tx_hash}")
 print(f"Explorer: https://testnet.arcscan.app/tx/{tx_hash}")
 
-try:
-    # Try to get transaction
-    tx = w3.eth.get_transaction(tx_hash)
-    print("\n✅ Transaction found!")
-    print(f"  From: {tx['from']}")
-    print(f"  To: {tx['to']}")
-    print(f"  Value: {tx['value']}")
-    print(f"  Gas: {tx['gas']}")
-    print(f"  Gas Price: {w3.from_wei(tx['gasPrice'], 'gwei')} Gwei")
-    print(f"  Nonce: {tx['nonce']}")
-
-    # Try to get receipt
-    try:
-        receipt = w3.eth.get_transaction_receipt(tx_hash)
-        print(f"\n✅ Transaction confirmed!")
-        print(f"  Block: {receipt['blockNumber']}")
-        print(f"  Gas Used: {receipt['gasUsed']}")
-        print(f"  Status: {'Success ✓' if receipt['status'] == 1 else 'Failed ✗'}")
-    except Exception as e:
-        print(f"\n⏳ Transaction pending (not mined yet)")
-        print(f"  The transaction exists but hasn't been included in a block yet")
+# Fetch transaction and receipt in one JSON-RPC batch round-trip
+# (web3 6.x has no batch_requests(), so the batch is posted directly)
+batch = [
+    {"jsonrpc": "2.0", "id": 0, "method": "eth_getTransactionByHash", "params": [tx_hash]},
+    {"jsonrpc": "2.0", "id": 1, "method": "eth_getTransactionReceipt", "params": [tx_hash]},
+]
 
+try:
+    response = httpx.post(RPC_URL, json=batch, timeout=30.0)
+    response.raise_for_status()
+    results = {item["id"]: item for item in response.json()}
 except Exception as e:
-    print(f"\n❌ Transaction not found: {e}")
+    print(f"\n❌ RPC request failed: {e}")
+    exit(1)
+
+tx = results[0].get("result")
+receipt = results[1].get("result")
+
+if tx is None:
+    error = results[0].get("error", {}).get("message", "not found")
+    print(f"\n❌ Transaction not found: {error}")
     print("The transaction was never broadcast or doesn't exist on this network")
+    exit(1)
+
+print("\n✅ Transaction found!")
+print(f"  From: {tx['from']}")
+print(f"  To: {tx['to']}")
+print(f"  Value: {int(tx['value'], 16)}")
+print(f"  Gas: {int(tx['gas'], 16)}")
+print(f"  Gas Price: {w3.from_wei(int(tx['gasPrice'], 16), 'gwei')} Gwei")
+print(f"  Nonce: {int(tx['nonce'], 16)}")
+
+if receipt is None:
+    print(f"\n⏳ Transaction pending (not mined yet)")
+    print(f"  The transaction exists but hasn't been included in a block yet")
+else:
+    print(f"\n✅ Transaction confirmed!")
+    print(f"  Block: {int(receipt['blockNumber'], 16)}")
+    print(f"  Gas Used: {int(receipt['gasUsed'], 16)}")
+    print(f"  Status: {'Success ✓' if int(receipt['status'], 16) == 1 else 'Failed ✗'}")
@@ -109,6 +109,7 @@ contract AuctionEscrow {
     error SettlementTimeoutNotReached();
     error DisputeWindowExpired();
     error InvalidPaymentProof();
+    error ArrayLengthMismatch();
 
     /**
      * @notice Constructor
@@ -188,31 +189,59 @@ contract AuctionEscrow {
      * @param _matchId ID of the match
      */
     function fundEscrow(bytes32 _matchId) external payable {
+        _fundEscrow(_matchId, msg.sender, msg.value);
+    }
+
+    /**
+     * @notice Fund escrow for several matches in a single transaction
+     * @dev One signed transaction covers every match, so the signer is
+     *      recovered once instead of once per match
+     * @param _matchIds IDs of the matches to fund
+     * @param _amounts Amount to escrow for each match (must sum to msg.value)
+     */
+    function fundEscrowBatch(bytes32[] calldata _matchIds, uint256[] calldata _amounts) external payable {
+        if (_matchIds.length != _amounts.length) revert ArrayLengthMismatch();
+
+        uint256 total;
+        for (uint256 i = 0; i < _matchIds.length; i++) {
+            total += _amounts[i];
+            _fundEscrow(_matchIds[i], msg.sender, _amounts[i]);
+        }
+
+        if (total != msg.value) revert InsufficientEscrow();
+    }
+
+    /**
+     * @notice Record an escrow deposit for a match participant
+     * @param _matchId ID of the match
+     * @param party Funding party
+     * @param amount Amount deposited
+     */
+    function _fundEscrow(bytes32 _matchId, address party, uint256 amount) internal {
         Match storage matchData = matches[_matchId];
 
         if (matchData.createdAt == 0) revert MatchNotFound();
         if (matchData.status != MatchStatus.Pending) revert InvalidMatchStatus();
 
-        address party = msg.sender;
         uint256 requiredAmount = matchData.matchPrice;
 
         if (party != matchData.bidder && party != matchData.asker) {
             revert UnauthorizedParty();
         }
 
-        if (msg.value < requiredAmount) revert InsufficientEscrow();
+        if (amount < requiredAmount) revert InsufficientEscrow();
 
         // Record escrow balance
-        escrowBalances[_matchId][party] = msg.value;
+        escrowBalances[_matchId][party] = amount;
 
         // Update match amounts
         if (party == matchData.bidder) {
-            matchData.bidAmount = msg.value;
+            matchData.bidAmount = amount;
         } else {
-            matchData.askAmount = msg.value;
+            matchData.askAmount = amount;
         }
 
-        emit EscrowFunded(_matchId, party, msg.value);
+        emit EscrowFunded(_matchId, party, amount);
 
         // Check if both parties have funded
         if (matchData.bidAmount >= requiredAmount && matchData.askAmount >= requiredAmount) {
@@ -102,6 +102,49 @@ contract AuctionEscrowTest is Test {
         assertEq(matchData.askAmount, matchPrice);
     }
 
+    function testFundEscrowBatch() public {
+        uint256 matchPrice = 1 ether;
+        bytes32 matchId1 = _createMatch(keccak256("bid_batch_1"), keccak256("ask_batch_1"), matchPrice);
+        bytes32 matchId2 = _createMatch(keccak256("bid_batch_2"), keccak256("ask_batch_2"), matchPrice);
+
+        bytes32[] memory matchIds = new bytes32[](2);
+        matchIds[0] = matchId1;
+        matchIds[1] = matchId2;
+
+        uint256[] memory amounts = new uint256[](2);
+        amounts[0] = matchPrice;
+        amounts[1] = matchPrice;
+
+        // Each party funds both matches in a single transaction
+        vm.prank(bidder);
+        escrow.fundEscrowBatch{value: matchPrice * 2}(matchIds, amounts);
+
+        vm.prank(asker);
+        escrow.fundEscrowBatch{value: matchPrice * 2}(matchIds, amounts);
+
+        for (uint256 i = 0; i < matchIds.length; i++) {
+            AuctionEscrow.Match memory matchData = escrow.getMatch(matchIds[i]);
+            assertEq(uint(matchData.status), uint(AuctionEscrow.MatchStatus.Funded));
+            assertEq(escrow.escrowBalances(matchIds[i], bidder), matchPrice);
+            assertEq(escrow.escrowBalances(matchIds[i], asker), matchPrice);
+        }
+    }
+
+    function testFundEscrowBatchRejectsValueMismatch() public {
+        uint256 matchPrice = 1 ether;
+        bytes32 matchId = _createMatch(INTENT_HASH_1, INTENT_HASH_2, matchPrice);
+
+        bytes32[] memory matchIds = new bytes32[](1);
+        matchIds[0] = matchId;
+
+        uint256[] memory amounts = new uint256[](1);
+        amounts[0] = matchPrice;
+
+        vm.prank(bidder);
+        vm.expectRevert(AuctionEscrow.InsufficientEscrow.selector);
+        escrow.fundEscrowBatch{value: matchPrice * 2}(matchIds, amounts);
+    }
+
     function testSettleMatch() public {
         // Setup intents and match
         vm.prank(bidder);
@@ -264,4 +307,24 @@ contract AuctionEscrowTest is Test {
         vm.expectRevert(AuctionEscrow.InvalidPaymentProof.selector);
         escrow.settleMatch(matchId, ap2ProofHash, "invalid_payment_id");
     }
+
+    function _createMatch(bytes32 bidHash, bytes32 askHash, uint256 matchPrice) internal returns (bytes32) {
+        vm.prank(bidder);
+        bytes32 bidIntentId = registry.registerIntent(
+            bidHash,
+            block.timestamp + 1 hours,
+            AP2_MANDATE_1,
+            "USD"
+        );
+
+        vm.prank(asker);
+        bytes32 askIntentId = registry.registerIntent(
+            askHash,
+            block.timestamp + 1 hours,
+            AP2_MANDATE_2,
+            "USD"
+        );
+
+        return escrow.createMatch(bidIntentId, askIntentId, matchPrice);
+    }
 }
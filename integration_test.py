@@ -65,30 +65,32 @@ async def test_integration():
         )
         print(f"✅ Ask intent submitted: {ask_result['intent_id'][:20]}...")
 
+        # Tests 4-7 are independent reads, so issue them concurrently
+        intents, orderbook, matches, response = await asyncio.gather(
+            sdk.list_intents(is_active=True, is_matched=False),
+            sdk.get_orderbook("USD"),
+            sdk.list_matches(),
+            sdk.http_client.get(f"{sdk.api_base_url}/health")
+        )
+
         # Test 4: List Intents
         print("\n📝 Test 4: List Active Intents")
-        intents = await sdk.list_intents(is_active=True, is_matched=False)
         print(f"✅ Found {len(intents)} active intents")
 
         # Test 5: Get Order Book
         print("\n📝 Test 5: Get Order Book")
-        orderbook = await sdk.get_orderbook("USD")
         print(f"✅ Order book: {len(orderbook['bids'])} bids, {len(orderbook['asks'])} asks")
         if orderbook['spread'] is not None:
             print(f"   Spread: {orderbook['spread']}")
 
         # Test 6: List Matches
         print("\n📝 Test 6: List Matches")
-        matches = await sdk.list_matches()
         print(f"✅ Found {len(matches)} matches")
 
         # Test 7: Health Check
         print("\n📝 Test 7: API Health Check")
-        import httpx
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:8000/health")
-            health = response.json()
-            print(f"✅ API Status: {health['status']}")
+        health = response.json()
+        print(f"✅ API Status: {health['status']}")
 
         print("\n" + "=" * 60)
         print("✅ All integration tests passed!")
@@ -5,15 +5,15 @@ Creates sample intents and matches directly in the database
 """
 import sys
 import os
-from datetime import datetime, timedelta
+import time
 import hashlib
+import heapq
 import random
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from services.indexer import IntentDB, MatchDB, Base
+from services.indexer import Base, enable_sqlite_fast_writes
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 # Use the same database as the API
 DB_URL = "sqlite:///arc_coordination.db"
@@ -23,21 +23,37 @@ TEST_ACCOUNT = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
 TEST_ACCOUNT_2 = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
 TEST_ACCOUNT_3 = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
 
-def generate_id(prefix: str) -> str:
-    """Generate a random hex ID"""
-    random_bytes = os.urandom(32)
-    return "0x" + random_bytes.hex()
+INTENT_COLUMNS = (
+    "intent_id", "intent_hash", "actor", "timestamp", "valid_until",
+    "ap2_mandate_id", "settlement_asset", "is_active", "is_matched", "payload"
+)
+MATCH_COLUMNS = (
+    "match_id", "bid_intent_id", "ask_intent_id", "bidder", "asker",
+    "match_price", "created_at", "settle_by", "status", "ap2_proof_hash"
+)
+INSERT_INTENT_SQL = (
+    f"INSERT INTO intents ({', '.join(INTENT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(INTENT_COLUMNS))})"
+)
+INSERT_MATCH_SQL = (
+    f"INSERT INTO matches ({', '.join(MATCH_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(MATCH_COLUMNS))})"
+)
+
+def random_offsets(n: int, span: int) -> list:
+    """Draw n independent random second offsets in [0, span], like randint(0, span)"""
+    return random.choices(range(span + 1), k=n)
 
 def generate_hash(data: str) -> str:
     """Generate SHA256 hash"""
-    return "0x" + hashlib.sha256(data.encode()).hexdigest()
+    return "0x" + hashlib.sha256(data.encode(), usedforsecurity=False).hexdigest()
 
-def create_mock_intents(session):
+def create_mock_intents(engine):
     """Create mock intents in database"""
     print("\n📝 Creating mock intents...")
 
-    now = int(datetime.now().timestamp())
-    one_week = int((datetime.now() + timedelta(days=7)).timestamp())
+    now = int(time.time())
+    one_week = now + 7 * 24 * 3600
 
     test_intents = [
         # Active Bids (buy orders)
@@ -126,26 +142,32 @@ def create_mock_intents(session):
     ]
 
     created_intents = []
-
-    for intent_data in test_intents:
-        intent_id = generate_id("intent")
-        intent_hash = generate_hash(f"{intent_data['type']}_{intent_data['price']}_{intent_data['quantity']}")
-        mandate_id = generate_id("mandate")
-
-        intent = IntentDB(
-            intent_id=intent_id,
-            intent_hash=intent_hash,
-            actor=intent_data['actor'],
-            timestamp=now - random.randint(0, 3600),  # Random time in last hour
-            valid_until=one_week,
-            ap2_mandate_id=mandate_id,
-            settlement_asset=intent_data['asset'],
-            is_active=True,
-            is_matched=False,
-            payload=None
-        )
-
-        session.add(intent)
+    rows = []
+
+    # One bulk random draw: 32 bytes for the intent ID + 32 for the mandate ID per row
+    rand = os.urandom(64 * len(test_intents))
+    offsets = random_offsets(len(test_intents), 3600)
+
+    for i, intent_data in enumerate(test_intents):
+        intent_id = "0x" + rand[i*64:i*64+32].hex()
+        mandate_id = "0x" + rand[i*64+32:i*64+64].hex()
+
+        h = hashlib.sha256(usedforsecurity=False)
+        h.update(f"{intent_data['type']}_{intent_data['price']}_{intent_data['quantity']}".encode())
+        intent_hash = "0x" + h.hexdigest()
+
+        rows.append((
+            intent_id,
+            intent_hash,
+            intent_data['actor'],
+            now - offsets[i],  # Random time in last hour
+            one_week,
+            mandate_id,
+            intent_data['asset'],
+            1,  # is_active
+            0,  # is_matched
+            None  # payload
+        ))
         created_intents.append({
             "intent_id": intent_id,
             "type": intent_data['type'],
@@ -153,18 +175,23 @@ def create_mock_intents(session):
             "description": intent_data['description'],
             "actor": intent_data['actor']
         })
-        print(f"  ✅ Created {intent_data['type']} intent: {intent_data['description']}")
 
-    session.commit()
+    # Raw executemany: SQLite prepares the statement once, no ORM mapping
+    with engine.begin() as conn:
+        conn.exec_driver_sql(INSERT_INTENT_SQL, rows)
+
+    for intent in created_intents:
+        print(f"  ✅ Created {intent['type']} intent: {intent['description']}")
+
     return created_intents
 
 
-def create_mock_matches(session, intents):
+def create_mock_matches(engine, intents):
     """Create some mock matches"""
     print("\n🔄 Creating mock matches...")
 
-    now = int(datetime.now().timestamp())
-    one_day = int((datetime.now() + timedelta(days=1)).timestamp())
+    now = int(time.time())
+    one_day = now + 24 * 3600
 
     # Create a few matches with different statuses
     bids = [i for i in intents if i['type'] == 'bid']
@@ -199,32 +226,41 @@ def create_mock_matches(session, intents):
 
     created_matches = []
 
-    for scenario in match_scenarios:
+    # One bulk random draw for all match IDs
+    rand = os.urandom(32 * len(match_scenarios))
+    offsets = random_offsets(len(match_scenarios), 7200)
+
+    for i, scenario in enumerate(match_scenarios):
         if scenario['bid_idx'] < len(bids) and scenario['ask_idx'] < len(asks):
             bid = bids[scenario['bid_idx']]
             ask = asks[scenario['ask_idx']]
 
-            match_id = generate_id("match")
+            match_id = "0x" + rand[i*32:i*32+32].hex()
             match_price = (bid['price'] + ask['price']) // 2
 
-            match = MatchDB(
-                match_id=match_id,
-                bid_intent_id=bid['intent_id'],
-                ask_intent_id=ask['intent_id'],
-                bidder=bid['actor'],
-                asker=ask['actor'],
-                match_price=match_price,
-                created_at=now - random.randint(0, 7200),  # Random time in last 2 hours
-                settle_by=one_day,
-                status=scenario['status'],
-                ap2_proof_hash=generate_hash(f"proof_{match_id}") if scenario['status'] == 'settled' else None
-            )
-
-            session.add(match)
-            created_matches.append(match)
-            print(f"  ✅ Created {scenario['status']} match: ${match_price:,}")
-
-    session.commit()
+            created_matches.append({
+                "match_id": match_id,
+                "bid_intent_id": bid['intent_id'],
+                "ask_intent_id": ask['intent_id'],
+                "bidder": bid['actor'],
+                "asker": ask['actor'],
+                "match_price": match_price,
+                "created_at": now - offsets[i],  # Random time in last 2 hours
+                "settle_by": one_day,
+                "status": scenario['status'],
+                "ap2_proof_hash": generate_hash(f"proof_{match_id}") if scenario['status'] == 'settled' else None
+            })
+
+    # Raw executemany: SQLite prepares the statement once, no ORM mapping
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            INSERT_MATCH_SQL,
+            [tuple(match[col] for col in MATCH_COLUMNS) for match in created_matches]
+        )
+
+    for match in created_matches:
+        print(f"  ✅ Created {match['status']} match: ${match['match_price']:,}")
+
     return created_matches
 
 
@@ -235,23 +271,22 @@ def populate_database():
     print("="*60)
 
     # Initialize database
-    engine = create_engine(DB_URL)
+    engine = create_engine(DB_URL, future=True)
+    enable_sqlite_fast_writes(engine)
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
 
     # Clear existing test data (optional)
     print("\n🗑️  Clearing existing data...")
-    session.query(MatchDB).delete()
-    session.query(IntentDB).delete()
-    session.commit()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM matches")
+        conn.exec_driver_sql("DELETE FROM intents")
     print("  ✅ Database cleared")
 
     # Create test data
-    intents = create_mock_intents(session)
-    matches = create_mock_matches(session, intents)
+    intents = create_mock_intents(engine)
+    matches = create_mock_matches(engine, intents)
 
-    session.close()
+    engine.dispose()
 
     # Print summary
     print("\n" + "="*60)
@@ -269,16 +304,16 @@ def populate_database():
 
     print(f"\n📖 Order Book Preview:")
     print(f"\n  BID SIDE (highest first):")
-    for bid in sorted(bids, key=lambda x: x['price'], reverse=True)[:5]:
+    for bid in heapq.nlargest(5, bids, key=lambda x: x['price']):
         print(f"    ${bid['price']:,} - {bid['description']}")
 
     print(f"\n  ASK SIDE (lowest first):")
-    for ask in sorted(asks, key=lambda x: x['price'])[:5]:
+    for ask in heapq.nsmallest(5, asks, key=lambda x: x['price']):
         print(f"    ${ask['price']:,} - {ask['description']}")
 
     print(f"\n🔄 Matches Created:")
     for match in matches:
-        print(f"    {match.status.upper()}: ${match.match_price:,}")
+        print(f"    {match['status'].upper()}: ${match['match_price']:,}")
 
     print(f"\n🌐 Access Points:")
     print(f"  Streamlit UI:  http://localhost:8502")
@@ -7,17 +7,17 @@ import asyncio
 import sys
 import os
 from datetime import datetime, timedelta
-from web3 import Web3
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
 from eth_account import Account
 import json
 import hashlib
+import httpx
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from services.indexer import ArcIndexer, IntentDB, MatchDB
+from services.indexer import ArcIndexer, Base, enable_sqlite_fast_writes
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
 load_dotenv("config/.env")
@@ -28,12 +28,33 @@ INTENT_REGISTRY = os.getenv("INTENT_REGISTRY_ADDRESS")
 AUCTION_ESCROW = os.getenv("AUCTION_ESCROW_ADDRESS")
 PAYMENT_ROUTER = os.getenv("PAYMENT_ROUTER_ADDRESS")
 PRIVATE_KEY = os.getenv("PRIVATE_KEY")
+
+# Checksummed once at import; reused wherever the address is needed
+INTENT_REGISTRY_CS = Web3.to_checksum_address(INTENT_REGISTRY)
 DB_URL = "sqlite:///data/arc_intents.db"
 
+# Receipt polling: local Anvil mines instantly, public RPC needs more slack
+if "localhost" in RPC_URL:
+    RECEIPT_TIMEOUT = 60
+    RECEIPT_POLL_LATENCY = 1.0
+else:
+    RECEIPT_TIMEOUT = 120
+    RECEIPT_POLL_LATENCY = 2.0
+
 # Initialize Web3
 w3 = Web3(Web3.HTTPProvider(RPC_URL))
 account = Account.from_key(PRIVATE_KEY)
 
+# Shared database engine
+_engine = create_engine(DB_URL, future=True)
+enable_sqlite_fast_writes(_engine)
+
+INSERT_INTENT_SQL = (
+    "INSERT INTO intents (intent_id, intent_hash, actor, timestamp, valid_until, "
+    "ap2_mandate_id, settlement_asset, is_active, is_matched) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
 print(f"Using account: {account.address}")
 print(f"Balance: {w3.eth.get_balance(account.address) / 10**18} ETH")
 
@@ -67,8 +88,13 @@ def get_intent_registry_abi():
     ]
 
 
-def create_test_intent(intent_type, price, quantity, asset, description):
-    """Create a test intent and submit to blockchain"""
+# Contract ABI and instance are built once per run
+_ABI = get_intent_registry_abi()
+_CONTRACT = w3.eth.contract(address=INTENT_REGISTRY_CS, abi=_ABI)
+
+
+def build_test_intent(intent_type, price, quantity, asset, description, nonce, gas_price):
+    """Build and sign a registerIntent transaction for a test intent"""
     print(f"\n📝 Creating {intent_type} intent: {description}")
 
     # Create intent payload
@@ -91,69 +117,140 @@ def create_test_intent(intent_type, price, quantity, asset, description):
     # Calculate valid_until (7 days from now)
     valid_until = int((datetime.now() + timedelta(days=7)).timestamp())
 
-    try:
-        # Get contract
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(INTENT_REGISTRY),
-            abi=get_intent_registry_abi()
-        )
-
-        # Build transaction
-        tx = contract.functions.registerIntent(
-            bytes.fromhex(intent_hash),
-            valid_until,
-            bytes.fromhex(mandate_id),
-            asset
-        ).build_transaction({
-            'from': account.address,
-            'nonce': w3.eth.get_transaction_count(account.address),
-            'gas': 300000,
-            'gasPrice': w3.eth.gas_price
-        })
-
-        # Sign and send
-        signed_tx = account.sign_transaction(tx)
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-
-        print(f"  ⏳ Transaction sent: {tx_hash.hex()}")
-
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
-
-        if receipt['status'] == 1:
+    # Build transaction
+    tx = _CONTRACT.functions.registerIntent(
+        bytes.fromhex(intent_hash),
+        valid_until,
+        bytes.fromhex(mandate_id),
+        asset
+    ).build_transaction({
+        'from': account.address,
+        'nonce': nonce,
+        'gas': 300000,
+        'gasPrice': gas_price
+    })
+
+    # Sign
+    signed_tx = account.sign_transaction(tx)
+
+    return {
+        "raw_tx": signed_tx.rawTransaction,
+        "intent_hash": intent_hash,
+        "mandate_id": mandate_id,
+        "valid_until": valid_until,
+        "asset": asset
+    }
+
+
+async def fetch_receipts(tx_hashes, timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY):
+    """
+    Poll receipts for all tx hashes with a single batched
+    eth_getTransactionReceipt JSON-RPC request per round
+    """
+    receipts = {}
+    deadline = asyncio.get_running_loop().time() + timeout
+
+    async with httpx.AsyncClient() as client:
+        while len(receipts) < len(tx_hashes):
+            pending = [h for h in tx_hashes if h not in receipts]
+            batch = [
+                {"jsonrpc": "2.0", "id": i, "method": "eth_getTransactionReceipt", "params": [h]}
+                for i, h in enumerate(pending)
+            ]
+            response = await client.post(RPC_URL, json=batch)
+            response.raise_for_status()
+
+            payload = response.json()
+            if not isinstance(payload, list):
+                # Nodes without batch support answer with a single error object
+                error = payload.get("error", payload) if isinstance(payload, dict) else payload
+                raise RuntimeError(f"RPC endpoint does not accept JSON-RPC batch requests: {error}")
+
+            for item in payload:
+                if item.get("result"):
+                    receipts[pending[item["id"]]] = item["result"]
+
+            if len(receipts) == len(tx_hashes):
+                break
+            if asyncio.get_running_loop().time() >= deadline:
+                print(f"  ⚠️  Timed out waiting for {len(tx_hashes) - len(receipts)} receipt(s)")
+                break
+            await asyncio.sleep(poll_latency)
+
+    return receipts
+
+
+def intent_row(intent_id, built):
+    """Build the intents table row for a confirmed intent"""
+    return (
+        intent_id or f"0x{built['intent_hash']}",
+        f"0x{built['intent_hash']}",
+        account.address,
+        int(datetime.now().timestamp()),
+        built['valid_until'],
+        f"0x{built['mandate_id']}",
+        built['asset'],
+        1,  # is_active
+        0   # is_matched
+    )
+
+
+async def submit_test_intents(test_intents):
+    """
+    Sign all test intents with locally assigned nonces, broadcast them
+    concurrently and collect receipts in batched JSON-RPC calls
+    """
+    # Track the nonce locally; only advance it once a transaction is signed
+    nonce = w3.eth.get_transaction_count(account.address)
+    # All submissions happen within seconds, so one gas price quote suffices
+    gas_price = w3.eth.gas_price
+
+    signed_intents = []
+    built = []
+    for intent in test_intents:
+        try:
+            b = build_test_intent(*intent, nonce=nonce, gas_price=gas_price)
+        except Exception as e:
+            print(f"  ❌ Error: {e}")
+            continue
+        signed_intents.append(intent)
+        built.append(b)
+        nonce += 1
+
+    aw3 = AsyncWeb3(AsyncHTTPProvider(RPC_URL))
+    results = await asyncio.gather(
+        *[aw3.eth.send_raw_transaction(b["raw_tx"]) for b in built],
+        return_exceptions=True
+    )
+
+    tx_hashes = []
+    for b, result in zip(built, results):
+        if isinstance(result, Exception):
+            print(f"  ❌ Error: {result}")
+            b["tx_hash"] = None
+        else:
+            b["tx_hash"] = result.hex()
+            tx_hashes.append(b["tx_hash"])
+            print(f"  ⏳ Transaction sent: {b['tx_hash']}")
+
+    receipts = await fetch_receipts(tx_hashes) if tx_hashes else {}
+
+    created = []
+    for intent, b in zip(signed_intents, built):
+        receipt = receipts.get(b["tx_hash"])
+        if receipt is None:
+            continue
+
+        if int(receipt['status'], 16) == 1:
             # Parse the IntentRegistered event
-            intent_id = receipt['logs'][0]['topics'][1].hex() if receipt['logs'] else None
+            intent_id = receipt['logs'][0]['topics'][1] if receipt['logs'] else None
             print(f"  ✅ Intent created: {intent_id}")
 
-            # Store in database
-            engine = create_engine(DB_URL)
-            Session = sessionmaker(bind=engine)
-            session = Session()
-
-            intent_db = IntentDB(
-                intent_id=intent_id or f"0x{intent_hash}",
-                intent_hash=f"0x{intent_hash}",
-                actor=account.address,
-                timestamp=int(datetime.now().timestamp()),
-                valid_until=valid_until,
-                ap2_mandate_id=f"0x{mandate_id}",
-                settlement_asset=asset,
-                is_active=True,
-                is_matched=False
-            )
-
-            session.add(intent_db)
-            session.commit()
-            session.close()
-
-            return intent_id, intent_hash
+            created.append((intent, intent_id, b["intent_hash"], intent_row(intent_id, b)))
         else:
-            print(f"  ❌ Transaction failed")
-            return None, None
+            print(f"  ❌ Transaction failed: {b['tx_hash']}")
 
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
-        return None, None
+    return created
 
 
 def populate_database():
@@ -166,9 +263,7 @@ def populate_database():
     os.makedirs("data", exist_ok=True)
 
     # Initialize database
-    engine = create_engine(DB_URL)
-    IntentDB.metadata.create_all(engine)
-    MatchDB.metadata.create_all(engine)
+    Base.metadata.create_all(_engine)
 
     print("\n✅ Database initialized")
 
@@ -193,10 +288,14 @@ def populate_database():
 
     created_intents = []
 
-    for intent_type, price, quantity, asset, description in test_intents:
-        intent_id, intent_hash = create_test_intent(
-            intent_type, price, quantity, asset, description
-        )
+    created = asyncio.run(submit_test_intents(test_intents))
+
+    # One raw executemany in a single transaction for all confirmed intents
+    if created:
+        with _engine.begin() as conn:
+            conn.exec_driver_sql(INSERT_INTENT_SQL, [row for *_, row in created])
+
+    for (intent_type, price, quantity, asset, description), intent_id, intent_hash, _ in created:
         if intent_id:
             created_intents.append({
                 "intent_id": intent_id,
@@ -207,10 +306,6 @@ def populate_database():
                 "description": description
             })
 
-        # Small delay to avoid nonce issues
-        import time
-        time.sleep(0.5)
-
     print("\n" + "="*60)
     print(f"✅ Created {len(created_intents)} test intents")
     print("="*60)
@@ -10,6 +10,9 @@ import os
 # Add to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Shared keep-alive client for all endpoint checks
+client = httpx.AsyncClient(base_url="http://localhost:8000", timeout=10.0)
+
 def start_api():
     """Start API server in background thread"""
     from services.api import app
@@ -17,17 +20,31 @@ def start_api():
     server = uvicorn.Server(config)
     server.run()
 
+async def wait_for_api(timeout=10.0):
+    """Poll /health with short backoff until the API answers 200"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get("/health")
+            if response.status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, 0.25)
+    return False
+
 async def test_health():
     """Test the health endpoint"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:8000/health")
-            if response.status_code == 200:
-                print(f"✅ Health check passed: {response.json()}")
-                return True
-            else:
-                print(f"❌ Health check failed: {response.status_code}")
-                return False
+        response = await client.get("/health")
+        if response.status_code == 200:
+            print(f"✅ Health check passed: {response.json()}")
+            return True
+        else:
+            print(f"❌ Health check failed: {response.status_code}")
+            return False
     except Exception as e:
         print(f"❌ Health check error: {e}")
         return False
@@ -35,20 +52,35 @@ async def test_health():
 async def test_endpoints():
     """Test various API endpoints"""
     try:
-        async with httpx.AsyncClient() as client:
-            # Test intents list
-            response = await client.get("http://localhost:8000/intents")
-            print(f"✅ GET /intents: {response.status_code} - {len(response.json())} intents")
+        # Test intents list
+        response = await client.get("/intents")
+        print(f"✅ GET /intents: {response.status_code} - {len(response.json())} intents")
 
-            # Test matches list
-            response = await client.get("http://localhost:8000/matches")
-            print(f"✅ GET /matches: {response.status_code} - {len(response.json())} matches")
+        # Test matches list
+        response = await client.get("/matches")
+        print(f"✅ GET /matches: {response.status_code} - {len(response.json())} matches")
 
         return True
     except Exception as e:
         print(f"❌ Endpoint test error: {e}")
         return False
 
+async def run_tests():
+    """Run all API tests over the shared client"""
+    try:
+        # Wait for API to start
+        print("Waiting for API to start...")
+        if not await wait_for_api():
+            print("❌ API did not become ready in time")
+            return False
+
+        health_ok = await test_health()
+        if health_ok:
+            await test_endpoints()
+        return health_ok
+    finally:
+        await client.aclose()
+
 if __name__ == "__main__":
     print("Starting API test...\n")
 
@@ -56,15 +88,8 @@ if __name__ == "__main__":
     api_thread = threading.Thread(target=start_api, daemon=True)
     api_thread.start()
 
-    # Wait for API to start
-    print("Waiting for API to start...")
-    time.sleep(5)
-
     # Run tests
-    health_ok = asyncio.run(test_health())
-
-    if health_ok:
-        asyncio.run(test_endpoints())
+    if asyncio.run(run_tests()):
         print("\n✅ API tests passed!")
     else:
         print("\n❌ API tests failed!")
@@ -3,16 +3,233 @@ Arc Coordination System Python SDK
 Provides high-level interface for intent lifecycle management
 """
 import os
-import json
-import hashlib
-from typing import Dict, List, Optional
+import sys
+import time
+import asyncio
+import math
+import multiprocessing
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import httpx
-from web3 import Web3
+import orjson
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
 from eth_account import Account
 from loguru import logger
 
 
+# Per-request info logs on hot SDK methods (set ARC_LOG_INTENTS=0 to disable)
+LOG_INTENTS = os.getenv("ARC_LOG_INTENTS", "1") != "0"
+
+# AuctionEscrow ABI (only the functions the SDK calls)
+ESCROW_ABI = [
+    {
+        "inputs": [{"name": "_matchId", "type": "bytes32"}],
+        "name": "fundEscrow",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"name": "_matchIds", "type": "bytes32[]"},
+            {"name": "_amounts", "type": "uint256[]"}
+        ],
+        "name": "fundEscrowBatch",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# Gas limit for fundEscrow and how long cached EIP-1559 fees stay valid
+FUND_ESCROW_GAS = 300000
+FEE_CACHE_TTL = 30.0
+
+# Response cache TTLs (seconds); terminal intents/matches never change
+INTENT_CACHE_TTL = 2.0
+MATCH_CACHE_TTL = 2.0
+ORDERBOOK_CACHE_TTL = 0.5
+ORDERBOOK_RANK_MAX = 1024  # assets tracked for the hot-set ranking
+TERMINAL_MATCH_STATUSES = {"settled", "cancelled"}
+
+
+class _ResponseCache:
+    """
+    LRU cache of GET responses with per-entry expiry and ETag
+
+    Bodies are kept as the raw JSON bytes, which are immutable, so a
+    caller mutating a decoded response cannot corrupt later reads.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, Tuple[Optional[str], bytes, float]]" = OrderedDict()
+
+    def get(self, key) -> Optional[Tuple[Optional[str], bytes, float]]:
+        """Get (etag, raw body, expires_at) for key, marking it recently used"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, etag: Optional[str], body: bytes, ttl: float):
+        """Store a raw response body for ttl seconds"""
+        self._entries[key] = (etag, body, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Drop a cached response"""
+        self._entries.pop(key, None)
+
+
+# Shared HTTP clients keyed by API base URL, with a reference count per client
+_SHARED_CLIENTS: Dict[str, Tuple[httpx.AsyncClient, int]] = {}
+
+
+def _get_shared_client(api_base_url: str) -> httpx.AsyncClient:
+    """Get (or lazily create) the pooled HTTP/2 client for an API base URL"""
+    client, refs = _SHARED_CLIENTS.get(api_base_url, (None, 0))
+    if client is None or client.is_closed:
+        # Pool limits and HTTP/2 are transport settings when a transport is given
+        client = httpx.AsyncClient(
+            base_url=api_base_url,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0
+                ),
+                retries=2
+            )
+        )
+        refs = 0
+    _SHARED_CLIENTS[api_base_url] = (client, refs + 1)
+    return client
+
+
+async def _release_shared_client(api_base_url: str) -> None:
+    """Drop one reference to a shared client, closing it with the last one"""
+    client, refs = _SHARED_CLIENTS.get(api_base_url, (None, 0))
+    if client is None:
+        return
+    if refs <= 1:
+        del _SHARED_CLIENTS[api_base_url]
+        await client.aclose()
+    else:
+        _SHARED_CLIENTS[api_base_url] = (client, refs - 1)
+
+
+@lru_cache(maxsize=4096)
+def _match_id_from_hex(match_id: str) -> bytes:
+    """Decode a hex match ID once; repeat settlements reuse the bytes"""
+    return bytes.fromhex(match_id.removeprefix("0x"))
+
+
+def _match_id_bytes(match_id: Union[str, bytes]) -> bytes:
+    """Binary form of a match ID, as passed to AuctionEscrow"""
+    return match_id if isinstance(match_id, bytes) else _match_id_from_hex(match_id)
+
+
+def _match_id_hex(match_id: Union[str, bytes]) -> str:
+    """Hex form of a match ID, as returned to callers and the API"""
+    return match_id.hex() if isinstance(match_id, bytes) else match_id
+
+
+def _sign_tx(private_key: str, tx: Dict) -> bytes:
+    """Sign a transaction and return the raw bytes"""
+    return Account.sign_transaction(tx, private_key).raw_transaction
+
+
+# Signing account of a signer pool worker process, set once by its initializer
+_WORKER_ACCOUNT = None
+
+
+def _init_signer_worker(private_key: str):
+    """Signer pool initializer: receive the key once per worker, not per task"""
+    global _WORKER_ACCOUNT
+    _WORKER_ACCOUNT = Account.from_key(private_key)
+
+
+def _sign_tx_in_worker(tx: Dict) -> bytes:
+    """Sign a transaction with the worker's account (runs in a signer pool process)"""
+    return _WORKER_ACCOUNT.sign_transaction(tx).raw_transaction
+
+
+# Signing takes milliseconds, so a couple of workers per signer is plenty
+SIGNER_POOL_MAX_WORKERS = 2
+
+# Signer pools keyed by account address, created on first use and shared by SDK instances
+_SIGNER_POOLS: Dict[str, ProcessPoolExecutor] = {}
+
+
+def _get_signer_pool(address: str, private_key: str) -> Optional[ProcessPoolExecutor]:
+    """
+    Get (or lazily create) the signing pool for an account
+
+    Workers are spawned (forking a threaded host is unsafe) and receive
+    the key once through the initializer. Single-CPU hosts get None and
+    sign in a thread instead.
+    """
+    cpu_count = os.cpu_count() or 1
+    if cpu_count <= 1:
+        return None
+    pool = _SIGNER_POOLS.get(address)
+    if pool is None:
+        pool = _SIGNER_POOLS[address] = ProcessPoolExecutor(
+            max_workers=min(SIGNER_POOL_MAX_WORKERS, cpu_count),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_signer_worker,
+            initargs=(private_key,)
+        )
+    return pool
+
+
+def iouring_supported() -> bool:
+    """
+    Check whether io_uring was requested and the host kernel supports it
+
+    Opt-in via ARC_USE_IOURING=1; requires Linux 5.6+ (IORING_OP_SEND/RECV).
+    """
+    if os.getenv("ARC_USE_IOURING") != "1" or not sys.platform.startswith("linux"):
+        return False
+    release = os.uname().release.split("-", 1)[0].split(".")
+    try:
+        return (int(release[0]), int(release[1])) >= (5, 6)
+    except (IndexError, ValueError):
+        return False
+
+
+def install_uvloop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy when available
+
+    Call before asyncio.run(); falls back to the default loop on Windows
+    or when uvloop is not installed. With ARC_USE_IOURING=1 the host is
+    checked for io_uring support and the result logged; sockets still go
+    through uvloop's reactor until an io_uring transport is available.
+
+    Returns:
+        True if uvloop was installed
+    """
+    if sys.platform == "win32":
+        return False
+    if os.getenv("ARC_USE_IOURING") == "1":
+        logger.info("io_uring requested; kernel support: {}", iouring_supported())
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
 class ArcSDK:
     """
     Python SDK for Arc Coordination System
@@ -45,16 +262,34 @@ class ArcSDK:
             payment_router_address: PaymentRouter contract address
         """
         self.api_base_url = api_base_url.rstrip("/")
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.w3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
         self.account = Account.from_key(private_key)
+        self._private_key = private_key
 
         self.intent_registry_address = Web3.to_checksum_address(intent_registry_address)
         self.auction_escrow_address = Web3.to_checksum_address(auction_escrow_address)
         self.payment_router_address = Web3.to_checksum_address(payment_router_address)
 
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # Built once: contract construction parses the ABI and function selectors
+        self._escrow_contract = self.w3.eth.contract(
+            address=self.auction_escrow_address,
+            abi=ESCROW_ABI
+        )
+
+        self.http_client = _get_shared_client(self.api_base_url)
+        self._closed = False
+        self._cache = _ResponseCache()
+        self._orderbook_hits: Counter = Counter()
+        self._orderbook_refresher: Optional[asyncio.Task] = None
 
-        logger.info(f"Arc SDK initialized for address: {self.account.address}")
+        # Chain parameters, loaded lazily on the first transaction
+        self._nonce: Optional[int] = None
+        self._nonce_lock = asyncio.Lock()
+        self._chain_id: Optional[int] = None
+        self._fee_cache: Optional[Dict[str, int]] = None
+        self._fee_cache_time = 0.0
+
+        logger.info("Arc SDK initialized for address: {}", self.account.address)
 
     # Intent Methods
 
@@ -79,22 +314,61 @@ class ArcSDK:
         Returns:
             Intent submission result with intent_id and tx_hash
         """
+        return await self._post_intent(orjson.dumps({
+            "intent_payload": intent_payload,
+            "valid_until": valid_until,
+            "ap2_mandate_id": ap2_mandate_id,
+            "settlement_asset": settlement_asset,
+            "constraints": constraints or {}
+        }))
+
+    def make_submitter(
+        self,
+        settlement_asset: str,
+        constraints: Optional[Dict] = None
+    ) -> Callable[[Dict, int, str], Awaitable[Dict]]:
+        """
+        Build a submit_intent specialized for a fixed venue configuration
+
+        The settlement asset and constraints are serialized once into a
+        byte suffix, so each call only encodes the fields that vary.
+
+        Args:
+            settlement_asset: Asset for settlement (e.g., "USD", "ETH")
+            constraints: Additional constraints
+
+        Returns:
+            Coroutine function taking (intent_payload, valid_until, ap2_mandate_id)
+        """
+        suffix = orjson.dumps({
+            "settlement_asset": settlement_asset,
+            "constraints": constraints or {}
+        })[1:]
+
+        async def submit(intent_payload: Dict, valid_until: int, ap2_mandate_id: str) -> Dict:
+            return await self._post_intent(b"".join((
+                b'{"intent_payload":', orjson.dumps(intent_payload),
+                b',"valid_until":', orjson.dumps(valid_until),
+                b',"ap2_mandate_id":', orjson.dumps(ap2_mandate_id),
+                b",", suffix
+            )))
+
+        return submit
+
+    async def _post_intent(self, body: bytes) -> Dict:
+        """POST a serialized intent submission"""
         try:
             response = await self.http_client.post(
                 f"{self.api_base_url}/intents/submit",
-                json={
-                    "intent_payload": intent_payload,
-                    "valid_until": valid_until,
-                    "ap2_mandate_id": ap2_mandate_id,
-                    "settlement_asset": settlement_asset,
-                    "constraints": constraints or {}
-                }
+                content=body,
+                headers={"Content-Type": "application/json"}
             )
 
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
-            logger.info(f"Intent submitted: {result['intent_id']}")
+            if LOG_INTENTS:
+                logger.info("Intent submitted: {}", result['intent_id'])
             return result
 
         except httpx.HTTPError as e:
@@ -104,13 +378,14 @@ class ArcSDK:
     async def get_intent(self, intent_id: str) -> Dict:
         """Get intent details by ID"""
         try:
-            response = await self.http_client.get(
-                f"{self.api_base_url}/intents/{intent_id}"
+            return await self._cached_get(
+                ("intent", intent_id),
+                f"{self.api_base_url}/intents/{intent_id}",
+                lambda intent: math.inf if (
+                    not intent.get("is_active") or intent.get("valid_until", math.inf) < time.time()
+                ) else INTENT_CACHE_TTL
             )
 
-            response.raise_for_status()
-            return response.json()
-
         except httpx.HTTPError as e:
             logger.error(f"Error getting intent: {e}")
             raise
@@ -147,23 +422,79 @@ class ArcSDK:
             )
 
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except httpx.HTTPError as e:
             logger.error(f"Error listing intents: {e}")
             raise
 
+    async def submit_intents_bulk(
+        self,
+        submissions: List[Dict],
+        max_concurrency: int = 32
+    ) -> List[Dict]:
+        """
+        Submit many intents concurrently over the shared HTTP client
+
+        Args:
+            submissions: List of submit_intent keyword argument dicts
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            Submission result for each intent, in input order; failed
+            submissions are returned as the raised exception
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _submit_one(submission: Dict) -> Dict:
+            async with sem:
+                return await self.submit_intent(**submission)
+
+        return await asyncio.gather(
+            *[_submit_one(submission) for submission in submissions],
+            return_exceptions=True
+        )
+
+    async def get_intents_bulk(
+        self,
+        intent_ids: List[str],
+        max_concurrency: int = 32
+    ) -> List[Dict]:
+        """
+        Fetch many intents concurrently over the shared HTTP client
+
+        Args:
+            intent_ids: Intent IDs to fetch
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            Intent details for each ID, in input order; failed lookups
+            are returned as the raised exception
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _get_one(intent_id: str) -> Dict:
+            async with sem:
+                return await self.get_intent(intent_id)
+
+        return await asyncio.gather(
+            *[_get_one(intent_id) for intent_id in intent_ids],
+            return_exceptions=True
+        )
+
     async def cancel_intent(self, intent_id: str) -> Dict:
         """Cancel an active intent"""
         try:
             response = await self.http_client.post(
                 f"{self.api_base_url}/intents/{intent_id}/cancel"
             )
+            self._cache.invalidate(("intent", intent_id))
 
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
-            logger.info(f"Intent cancelled: {intent_id}")
+            if LOG_INTENTS:
+                logger.info("Intent cancelled: {}", intent_id)
             return result
 
         except httpx.HTTPError as e:
@@ -175,13 +506,12 @@ class ArcSDK:
     async def get_match(self, match_id: str) -> Dict:
         """Get match details by ID"""
         try:
-            response = await self.http_client.get(
-                f"{self.api_base_url}/matches/{match_id}"
+            return await self._cached_get(
+                ("match", match_id),
+                f"{self.api_base_url}/matches/{match_id}",
+                lambda match: math.inf if match.get("status") in TERMINAL_MATCH_STATUSES else MATCH_CACHE_TTL
             )
 
-            response.raise_for_status()
-            return response.json()
-
         except httpx.HTTPError as e:
             logger.error(f"Error getting match: {e}")
             raise
@@ -218,56 +548,143 @@ class ArcSDK:
             )
 
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except httpx.HTTPError as e:
             logger.error(f"Error listing matches: {e}")
             raise
 
-    async def fund_escrow(self, match_id: str, amount: int) -> Dict:
+    async def fund_escrow(self, match_id: Union[str, bytes], amount: int) -> Dict:
         """
         Fund escrow for a match
 
         Args:
-            match_id: Match ID
+            match_id: Match ID, as hex or raw bytes
             amount: Amount in wei
 
         Returns:
             Transaction result
         """
         try:
-            contract = self.w3.eth.contract(
-                address=self.auction_escrow_address,
-                abi=self._get_escrow_abi()
-            )
-
-            tx = contract.functions.fundEscrow(
-                bytes.fromhex(match_id)
-            ).build_transaction({
-                'from': self.account.address,
-                'value': amount,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                'gas': 300000,
-                'gasPrice': self.w3.eth.gas_price
-            })
+            fees = await self._get_fee_params()
+            nonce = await self._next_nonce()
+            tx = await self._build_fund_escrow_tx(match_id, amount, nonce, fees)
+            tx_hash = await self._sign_and_send(tx)
 
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
 
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-
-            logger.info(f"Escrow funded for match {match_id}. Tx: {tx_hash.hex()}")
+            logger.info("Escrow funded for match {}. Tx: {}", _match_id_hex(match_id), tx_hash.hex())
 
             return {
-                "match_id": match_id,
+                "match_id": _match_id_hex(match_id),
                 "tx_hash": tx_hash.hex(),
                 "status": "success" if receipt['status'] == 1 else "failed"
             }
 
         except Exception as e:
+            # A reserved nonce may never have been broadcast; refetch on next use
+            self._nonce = None
             logger.error(f"Error funding escrow: {e}")
             raise
 
+    async def fund_escrow_batch(
+        self,
+        match_ids: List[Union[str, bytes]],
+        amounts: List[int],
+        single_tx: bool = False
+    ) -> List[Dict]:
+        """
+        Fund escrow for several matches at once
+
+        By default nonces are assigned locally in order, then all
+        transactions are signed and broadcast concurrently before waiting
+        for receipts. With single_tx, every match is funded through one
+        AuctionEscrow.fundEscrowBatch call, so only one transaction is
+        signed and one signature recovered on-chain.
+
+        Args:
+            match_ids: Match IDs, as hex or raw bytes
+            amounts: Amount in wei for each match
+            single_tx: Fund all matches in one fundEscrowBatch transaction
+
+        Returns:
+            Transaction result for each match, in input order
+        """
+        if len(match_ids) != len(amounts):
+            raise ValueError("match_ids and amounts must have the same length")
+
+        if single_tx:
+            return await self._fund_escrow_single_tx(match_ids, amounts)
+
+        try:
+            fees = await self._get_fee_params()
+            async with self._nonce_lock:
+                await self._load_nonce()
+                first_nonce = self._nonce
+                self._nonce += len(match_ids)
+
+            txs = await asyncio.gather(*[
+                self._build_fund_escrow_tx(match_id, amount, first_nonce + i, fees)
+                for i, (match_id, amount) in enumerate(zip(match_ids, amounts))
+            ])
+            tx_hashes = await asyncio.gather(*[self._sign_and_send(tx) for tx in txs])
+
+            receipts = await asyncio.gather(*[
+                self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                for tx_hash in tx_hashes
+            ])
+
+            logger.info("Escrow funded for {} matches", len(match_ids))
+
+            return [
+                {
+                    "match_id": _match_id_hex(match_id),
+                    "tx_hash": tx_hash.hex(),
+                    "status": "success" if receipt['status'] == 1 else "failed"
+                }
+                for match_id, tx_hash, receipt in zip(match_ids, tx_hashes, receipts)
+            ]
+
+        except Exception as e:
+            # Reserved nonces may never have been broadcast; refetch on next use
+            self._nonce = None
+            logger.error(f"Error funding escrow batch: {e}")
+            raise
+
+    async def _fund_escrow_single_tx(self, match_ids: List[Union[str, bytes]], amounts: List[int]) -> List[Dict]:
+        """Fund several matches with one fundEscrowBatch transaction"""
+        try:
+            fees = await self._get_fee_params()
+            nonce = await self._next_nonce()
+
+            tx = await self._escrow_contract.functions.fundEscrowBatch(
+                [_match_id_bytes(match_id) for match_id in match_ids],
+                amounts
+            ).build_transaction({
+                'from': self.account.address,
+                'value': sum(amounts),
+                'nonce': nonce,
+                'gas': FUND_ESCROW_GAS * len(match_ids),
+                **fees
+            })
+            tx_hash = await self._sign_and_send(tx)
+
+            receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            status = "success" if receipt['status'] == 1 else "failed"
+
+            logger.info("Escrow funded for {} matches in one tx: {}", len(match_ids), tx_hash.hex())
+
+            return [
+                {"match_id": _match_id_hex(match_id), "tx_hash": tx_hash.hex(), "status": status}
+                for match_id in match_ids
+            ]
+
+        except Exception as e:
+            # Reserved nonces may never have been broadcast; refetch on next use
+            self._nonce = None
+            logger.error(f"Error funding escrow batch: {e}")
+            raise
+
     # Payment Methods
 
     async def create_payment_intent(
@@ -304,9 +721,10 @@ class ArcSDK:
             )
 
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
-            logger.info(f"Payment intent created: {result['payment_intent_id']}")
+            if LOG_INTENTS:
+                logger.info("Payment intent created: {}", result['payment_intent_id'])
             return result
 
         except httpx.HTTPError as e:
@@ -322,9 +740,10 @@ class ArcSDK:
             )
 
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
-            logger.info(f"Payment verified: {payment_intent_id}")
+            if LOG_INTENTS:
+                logger.info("Payment verified: {}", payment_intent_id)
             return result
 
         except httpx.HTTPError as e:
@@ -355,9 +774,10 @@ class ArcSDK:
             )
 
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
-            logger.info(f"Mandate registered: {mandate_id}")
+            if LOG_INTENTS:
+                logger.info("Mandate registered: {}", mandate_id)
             return result
 
         except httpx.HTTPError as e:
@@ -368,35 +788,164 @@ class ArcSDK:
 
     async def get_orderbook(self, asset: str) -> Dict:
         """Get current order book for an asset"""
+        self._orderbook_hits[asset] += 1
+        if len(self._orderbook_hits) > ORDERBOOK_RANK_MAX:
+            # Forget the long tail so the ranking stays bounded
+            self._orderbook_hits = Counter(dict(self._orderbook_hits.most_common(ORDERBOOK_RANK_MAX // 2)))
+
         try:
-            response = await self.http_client.get(
-                f"{self.api_base_url}/orderbook/{asset}"
+            # Short TTL coalesces bursts of agent reads
+            return await self._cached_get(
+                ("orderbook", asset),
+                f"{self.api_base_url}/orderbook/{asset}",
+                lambda orderbook: ORDERBOOK_CACHE_TTL
             )
 
-            response.raise_for_status()
-            return response.json()
-
         except httpx.HTTPError as e:
             logger.error(f"Error getting order book: {e}")
             raise
 
     # Helper Methods
 
-    def _get_escrow_abi(self):
-        """Get AuctionEscrow contract ABI"""
-        return [
-            {
-                "inputs": [{"name": "_matchId", "type": "bytes32"}],
-                "name": "fundEscrow",
-                "outputs": [],
-                "stateMutability": "payable",
-                "type": "function"
+    def start_orderbook_refresh(self, top_k: int = 32, interval: float = ORDERBOOK_CACHE_TTL):
+        """
+        Keep the most requested order books warm in the background
+
+        Every interval seconds the top_k assets by get_orderbook() traffic
+        are revalidated, so their reads are served from the cache. Other
+        assets keep the normal short-TTL path. Stopped by close().
+
+        Args:
+            top_k: Number of hot assets to refresh
+            interval: Seconds between refreshes
+        """
+        if self._orderbook_refresher is None or self._orderbook_refresher.done():
+            self._orderbook_refresher = asyncio.create_task(
+                self._refresh_top_orderbooks(top_k, interval)
+            )
+
+    async def _refresh_top_orderbooks(self, top_k: int, interval: float):
+        """Background loop behind start_orderbook_refresh()"""
+        # Refreshed entries outlive the interval so hot reads never miss
+        ttl = interval + ORDERBOOK_CACHE_TTL
+        while True:
+            assets = [asset for asset, _ in self._orderbook_hits.most_common(top_k)]
+            results = await asyncio.gather(*[
+                self._cached_get(
+                    ("orderbook", asset),
+                    f"{self.api_base_url}/orderbook/{asset}",
+                    lambda orderbook: ttl,
+                    force=True
+                )
+                for asset in assets
+            ], return_exceptions=True)
+            for asset, result in zip(assets, results):
+                if isinstance(result, Exception):
+                    logger.warning("Order book refresh failed for {}: {}", asset, result)
+            await asyncio.sleep(interval)
+
+    async def _cached_get(self, key, url: str, ttl_for, force: bool = False) -> Any:
+        """
+        GET a URL through the response cache
+
+        Fresh entries are returned without a request; stale entries are
+        revalidated with If-None-Match and reused on 304 Not Modified.
+        Every call decodes its own copy of the cached bytes.
+
+        Args:
+            key: Cache key
+            url: URL to fetch
+            ttl_for: Callable returning the TTL for a response body
+            force: Revalidate even if the cached entry is still fresh
+        """
+        entry = self._cache.get(key)
+        if not force and entry is not None and time.monotonic() < entry[2]:
+            return orjson.loads(entry[1])
+
+        headers = {}
+        if entry is not None and entry[0]:
+            headers["If-None-Match"] = entry[0]
+
+        response = await self.http_client.get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            content = entry[1]
+        else:
+            response.raise_for_status()
+            content = response.content
+
+        body = orjson.loads(content)
+        self._cache.put(key, response.headers.get("ETag"), content, ttl_for(body))
+        return body
+
+    async def _load_nonce(self):
+        """Fetch the pending nonce once; callers must hold _nonce_lock"""
+        if self._nonce is None:
+            self._nonce = await self.w3.eth.get_transaction_count(self.account.address, "pending")
+
+    async def _next_nonce(self) -> int:
+        """Reserve the next locally tracked nonce"""
+        async with self._nonce_lock:
+            await self._load_nonce()
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+
+    async def _get_fee_params(self) -> Dict[str, int]:
+        """Get chain ID and EIP-1559 fee fields, cached for FEE_CACHE_TTL seconds"""
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+
+        if self._fee_cache is None or time.monotonic() - self._fee_cache_time > FEE_CACHE_TTL:
+            latest, priority_fee = await asyncio.gather(
+                self.w3.eth.get_block("latest"),
+                self.w3.eth.max_priority_fee
+            )
+            self._fee_cache = {
+                "maxPriorityFeePerGas": priority_fee,
+                "maxFeePerGas": 2 * latest["baseFeePerGas"] + priority_fee
             }
-        ]
+            self._fee_cache_time = time.monotonic()
+
+        return {"chainId": self._chain_id, **self._fee_cache}
+
+    async def _build_fund_escrow_tx(self, match_id: Union[str, bytes], amount: int, nonce: int, fees: Dict[str, int]) -> Dict:
+        """Build a fundEscrow transaction without any RPC calls"""
+        return await self._escrow_contract.functions.fundEscrow(
+            _match_id_bytes(match_id)
+        ).build_transaction({
+            'from': self.account.address,
+            'value': amount,
+            'nonce': nonce,
+            'gas': FUND_ESCROW_GAS,
+            **fees
+        })
+
+    async def _sign_and_send(self, tx: Dict):
+        """Sign a transaction off the event loop and broadcast it"""
+        try:
+            # Signing is CPU-bound, so it runs outside the event loop (and the GIL)
+            signer_pool = _get_signer_pool(self.account.address, self._private_key)
+            if signer_pool is not None:
+                raw_tx = await asyncio.get_running_loop().run_in_executor(
+                    signer_pool, _sign_tx_in_worker, tx
+                )
+            else:
+                raw_tx = await asyncio.to_thread(_sign_tx, self._private_key, tx)
+            return await self.w3.eth.send_raw_transaction(raw_tx)
+        except Exception:
+            # The local nonce may be out of sync now; refetch on next use
+            self._nonce = None
+            raise
 
     async def close(self):
-        """Close HTTP client"""
-        await self.http_client.aclose()
+        """Release the shared HTTP client (closed when no SDK instance uses it)"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._orderbook_refresher is not None:
+            self._orderbook_refresher.cancel()
+        await _release_shared_client(self.api_base_url)
 
     async def __aenter__(self):
         return self
@@ -439,4 +988,5 @@ async def main():
 
 if __name__ == "__main__":
     import asyncio
+    install_uvloop()
     asyncio.run(main())
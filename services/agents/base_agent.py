@@ -9,19 +9,31 @@ Provides common functionality for all agents:
 - Error handling
 """
 
+import asyncio
+import bisect
 import logging
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Callable
+import time
+from collections import deque
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Callable, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
+import orjson
 
 from services.llm import LLMRouter, ModelPreference
 
 logger = logging.getLogger(__name__)
 
+# Offset from the monotonic clock to wall-clock time, taken once at import
+_MONOTONIC_EPOCH_NS = time.time_ns() - time.monotonic_ns()
 
-@dataclass
+
+def _wall_clock(monotonic_ns: int) -> datetime:
+    """Convert a time.monotonic_ns() reading to a local datetime"""
+    return datetime.fromtimestamp((monotonic_ns + _MONOTONIC_EPOCH_NS) / 1e9)
+
+
+@dataclass(slots=True)
 class AgentContext:
     """
     Context passed to agents containing:
@@ -47,12 +59,118 @@ class AgentContext:
     # Configuration
     config: Dict[str, Any] = field(default_factory=dict)
 
-    # Request metadata
+    # Request metadata (creation time as time.monotonic_ns())
     request_id: str = ""
-    timestamp: datetime = field(default_factory=datetime.now)
+    created_ns: int = field(default_factory=time.monotonic_ns)
+
+    # Per-request memo for tool results, keyed by (tool, argument)
+    tool_cache: Dict[Tuple[str, Any], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Active intents grouped by (intent_type, asset), built on first lookup
+    _intent_index: Optional[Dict[Tuple[str, str], List[Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # (prices, quantities) columns per (intent_type, asset), derived from the intent index on first lookup
+    _column_index: Optional[Dict[Tuple[str, str], Tuple[List[float], List[float]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Intents per lowercase actor as (sorted timestamps, intents in timestamp order), built on first lookup
+    _actor_index: Optional[Dict[str, Tuple[List[int], List[Any]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock creation time"""
+        return _wall_clock(self.created_ns)
+
+    def active_intents(self, intent_type: str, asset: str) -> List[Any]:
+        """
+        Get active intents of one type for an asset
 
+        The pool is grouped in a single pass on first use, so repeated
+        lookups within a request skip rescanning available_intents.
+        """
+        return self._get_intent_index().get((intent_type, asset), [])
+
+    def active_intent_count(self, asset: str) -> int:
+        """Count active intents of any type for an asset, from the same index"""
+        return self.asset_counts().get(asset, 0)
+
+    def asset_counts(self) -> Dict[str, int]:
+        """Count active intents of any type per asset, from the same index"""
+        counts: Dict[str, int] = {}
+        for (_, asset), intents in self._get_intent_index().items():
+            counts[asset] = counts.get(asset, 0) + len(intents)
+        return counts
+
+    def intent_columns(self, intent_type: str, asset: str) -> Tuple[List[float], List[float]]:
+        """
+        Get (prices, quantities) of active intents of one type for an asset
 
-@dataclass
+        Parallel float columns let aggregations run through the C
+        builtins (sum, min, max) without per-intent attribute loads.
+        """
+        if self._column_index is None:
+            self._column_index = {}
+        key = (intent_type, asset)
+        columns = self._column_index.get(key)
+        if columns is None:
+            intents = self.active_intents(intent_type, asset)
+            columns = ([intent.price for intent in intents], [intent.quantity for intent in intents])
+            self._column_index[key] = columns
+        return columns
+
+    def _get_intent_index(self) -> Dict[Tuple[str, str], List[Any]]:
+        """Group active intents by (intent_type, asset) on first use"""
+        if self._intent_index is None:
+            index: Dict[Tuple[str, str], List[Any]] = {}
+            for intent in self.available_intents:
+                if intent.is_active:
+                    index.setdefault((intent.intent_type, intent.asset), []).append(intent)
+            self._intent_index = index
+        return self._intent_index
+
+    def intents_by_actor(self, actor: str, since: int = 0) -> List[Any]:
+        """
+        Get an actor's intents with timestamp >= since, oldest first
+
+        Addresses match case-insensitively. The pool is indexed by each
+        intent's pre-normalized actor_lc on first use; the cutoff is a
+        bisect on that actor's sorted timestamps.
+        """
+        return self.actor_timeline(actor, since)[1]
+
+    def actor_timeline(self, actor: str, since: int = 0) -> Tuple[List[int], List[Any]]:
+        """
+        Get an actor's (timestamps, intents) with timestamp >= since, oldest first
+
+        The timestamps are the index's pre-sorted column, so callers
+        scanning for gaps need neither a sort nor attribute reads.
+        """
+        if self._actor_index is None:
+            grouped: Dict[str, List[Any]] = {}
+            for intent in self.available_intents:
+                grouped.setdefault(intent.actor_lc, []).append(intent)
+            index = {}
+            for key, intents in grouped.items():
+                intents.sort(key=lambda intent: intent.timestamp)
+                index[key] = ([intent.timestamp for intent in intents], intents)
+            self._actor_index = index
+
+        entry = self._actor_index.get(actor.lower())
+        if entry is None:
+            return [], []
+        timestamps, intents = entry
+        start = bisect.bisect_left(timestamps, since)
+        return timestamps[start:], intents[start:]
+
+
+@dataclass(slots=True)
 class AgentResult:
     """
     Result returned by agents
@@ -74,7 +192,12 @@ class AgentResult:
     next_agent: Optional[str] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    created_ns: int = field(default_factory=time.monotonic_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock creation time"""
+        return _wall_clock(self.created_ns)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -88,20 +211,27 @@ class AgentResult:
             "next_agent": self.next_agent,
             "error": self.error,
             "metadata": self.metadata,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": _wall_clock(self.created_ns).isoformat()
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes with the same shape as to_dict()"""
+        return orjson.dumps(self.to_dict())
+
 
-class BaseAgent(ABC):
+class BaseAgent:
     """
-    Abstract base class for all agents
+    Base class for all agents
 
     Subclasses must implement:
-    - get_system_prompt(): Return agent-specific system prompt
+    - SYSTEM_PROMPT (or get_system_prompt()): Agent-specific system prompt
     - get_tools(): Return list of tool definitions
     - execute_tool(): Handle tool execution
     - run(): Main agent logic
 
+    Unimplemented hooks raise NotImplementedError when called rather than
+    being enforced by an ABC metaclass at instantiation.
+
     Features:
     - Automatic LLM routing (Claude/Gemini)
     - Tool use support
@@ -110,6 +240,13 @@ class BaseAgent(ABC):
     - Structured output parsing
     """
 
+    # Static system prompt text; dynamic parts come from get_dynamic_system_suffix()
+    SYSTEM_PROMPT: str = ""
+
+    # Conversation history window (messages) and cap on the folded summary
+    max_history: int = 32
+    max_history_summary_chars: int = 2000
+
     def __init__(
         self,
         name: str,
@@ -131,16 +268,37 @@ class BaseAgent(ABC):
         self.llm_router = llm_router or LLMRouter()
         self.model_preference = model_preference
 
-        # Conversation history
-        self.messages: List[Dict[str, str]] = []
+        # Conversation history (bounded; evicted turns are folded into a summary)
+        self.messages: deque = deque(maxlen=self.max_history)
+        self.history_summary: str = ""
 
         # Tool registry
         self._tools: Dict[str, Callable] = {}
         self._register_tools()
 
-        logger.info(f"Initialized {name}: {description}")
+        logger.info("Initialized %s: %s", name, description)
+
+    @cached_property
+    def _static_system_prefix(self) -> str:
+        """Static part of the system prompt, resolved once per agent"""
+        if not self.SYSTEM_PROMPT:
+            raise NotImplementedError(
+                f"{type(self).__name__} must set SYSTEM_PROMPT or override get_system_prompt()"
+            )
+        return self.SYSTEM_PROMPT
+
+    def get_dynamic_system_suffix(self, context: AgentContext) -> str:
+        """
+        Get the context-dependent tail of the system prompt
+
+        Args:
+            context: Agent context with data
+
+        Returns:
+            Text appended to the static prefix (empty by default)
+        """
+        return ""
 
-    @abstractmethod
     def get_system_prompt(self, context: AgentContext) -> str:
         """
         Get agent-specific system prompt
@@ -151,19 +309,17 @@ class BaseAgent(ABC):
         Returns:
             System prompt string
         """
-        pass
+        return self._static_system_prefix + self.get_dynamic_system_suffix(context)
 
-    @abstractmethod
-    def get_tools(self) -> List[Dict[str, Any]]:
+    def get_tools(self) -> Sequence[Dict[str, Any]]:
         """
         Get tool definitions for this agent
 
         Returns:
-            List of tool definitions in Claude format
+            Tool definitions in Claude format
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement get_tools()")
 
-    @abstractmethod
     async def run(self, context: AgentContext) -> AgentResult:
         """
         Main agent execution logic
@@ -174,7 +330,7 @@ class BaseAgent(ABC):
         Returns:
             Agent result
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement run()")
 
     def _register_tools(self):
         """Register agent tools"""
@@ -184,7 +340,10 @@ class BaseAgent(ABC):
             if tool_name:
                 # Store tool definition
                 self._tools[tool_name] = tool
-        logger.debug(f"Registered {len(self._tools)} tools for {self.name}")
+
+        # Frozen tool list reused by every LLM call
+        self._tools_list: Tuple[Dict[str, Any], ...] = tuple(self._tools.values())
+        logger.debug("Registered %d tools for %s", len(self._tools), self.name)
 
     async def call_llm(
         self,
@@ -207,21 +366,25 @@ class BaseAgent(ABC):
         """
         # Build system prompt
         system_prompt = self.get_system_prompt(context) if context else None
+        if self.history_summary:
+            # Sent as a separate trailing part so the cached prompt prefix stays byte-stable
+            summary = f"Earlier conversation (summarized):\n{self.history_summary}"
+            system_prompt = [system_prompt or "", summary]
 
-        # Add user message to history
-        self.messages.append({"role": "user", "content": prompt})
+        # Make room for this user/assistant pair, then add user message
+        self._evict_history(reserve=2)
+        user_message = {"role": "user", "content": prompt}
+        self.messages.append(user_message)
 
         # Get tools if requested
-        tools = None
-        if use_tools and self._tools:
-            tools = list(self._tools.values())
+        tools = self._tools_list if use_tools and self._tools_list else None
 
         try:
             # Call LLM via router
             response = await self.llm_router.acomplete(
                 prompt=prompt,
                 system=system_prompt,
-                messages=self.messages,
+                messages=list(self.messages),
                 tools=tools,
                 preference=self.model_preference,
                 **kwargs
@@ -233,11 +396,18 @@ class BaseAgent(ABC):
                 "content": response["content"]
             })
 
-            logger.info(f"{self.name} LLM call: {response['usage']} tokens via {response['router_model']}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "%s LLM call: %s tokens via %s",
+                    self.name, response['usage'], response['router_model']
+                )
 
             return response
 
         except Exception as e:
+            # Drop the unanswered user turn so history keeps alternating roles
+            if self.messages and self.messages[-1] is user_message:
+                self.messages.pop()
             logger.error(f"{self.name} LLM error: {e}")
             raise
 
@@ -273,6 +443,9 @@ class BaseAgent(ABC):
         """
         Handle tool calls from LLM response
 
+        Independent tool calls from one turn run concurrently; results
+        keep the order of the calls.
+
         Args:
             response: LLM response with tool calls
             context: Agent context
@@ -281,64 +454,94 @@ class BaseAgent(ABC):
             List of tool results
         """
         tool_calls = response.get("tool_calls", [])
-        results = []
-
-        for tool_call in tool_calls:
-            tool_name = tool_call["name"]
-            tool_input = tool_call["input"]
-
-            logger.info(f"{self.name} executing tool: {tool_name}")
-
-            try:
-                result = await self.execute_tool(tool_name, tool_input, context)
-                results.append({
-                    "tool_call_id": tool_call["id"],
-                    "tool_name": tool_name,
-                    "result": result,
-                    "success": True
-                })
-            except Exception as e:
-                logger.error(f"Tool execution failed: {e}")
-                results.append({
-                    "tool_call_id": tool_call["id"],
-                    "tool_name": tool_name,
-                    "error": str(e),
-                    "success": False
-                })
-
-        return results
+        if len(tool_calls) == 1:
+            return [await self._run_tool(tool_calls[0], context)]
+
+        return list(await asyncio.gather(
+            *[self._run_tool(tool_call, context) for tool_call in tool_calls]
+        ))
+
+    async def _run_tool(
+        self,
+        tool_call: Dict[str, Any],
+        context: AgentContext
+    ) -> Dict[str, Any]:
+        """Execute one tool call, capturing failures in the result"""
+        tool_name = tool_call["name"]
+
+        logger.info("%s executing tool: %s", self.name, tool_name)
+
+        try:
+            result = await self.execute_tool(tool_name, tool_call["input"], context)
+            return {
+                "tool_call_id": tool_call["id"],
+                "tool_name": tool_name,
+                "result": result,
+                "success": True
+            }
+        except Exception as e:
+            logger.error(f"Tool execution failed: {e}")
+            return {
+                "tool_call_id": tool_call["id"],
+                "tool_name": tool_name,
+                "error": str(e),
+                "success": False
+            }
 
     def parse_json_output(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse JSON from LLM response
 
+        Accepts bare JSON or JSON inside a markdown code fence, parsed in
+        a single orjson pass.
+
         Args:
             response: LLM response
 
         Returns:
             Parsed JSON object
         """
+        content = response.get("content") or ""
+
+        # Strip a markdown code fence if the model wrapped its JSON in one
+        if "```" in content:
+            fenced = content.split("```json", 1)[1] if "```json" in content else content.split("```", 1)[1]
+            content = fenced.split("```", 1)[0]
+
         try:
-            # Try using Claude's parser first
-            return self.llm_router.claude.parse_json_response(response)
-        except Exception as e:
-            # Fallback to Gemini parser
-            try:
-                return self.llm_router.gemini.parse_json_response(response)
-            except Exception:
-                # Last resort: extract from content
-                content = response.get("content", "")
-                logger.error(f"Failed to parse JSON from response: {content[:200]}")
-                raise e
+            return orjson.loads(content.strip())
+        except orjson.JSONDecodeError:
+            logger.error(f"Failed to parse JSON from response: {content[:200]}")
+            raise
+
+    def _evict_history(self, reserve: int = 0):
+        """
+        Evict the oldest turns until reserve slots are free and the
+        history starts with a user turn
+
+        Evicted turns are folded into history_summary with a cheap
+        template so earlier context is not lost entirely.
+        """
+        while self.messages and (
+            len(self.messages) + reserve > self.max_history
+            or self.messages[0].get("role") != "user"
+        ):
+            evicted = self.messages.popleft()
+            content = str(evicted.get("content", "")).replace("\n", " ")
+            self.history_summary += f"- {evicted.get('role')}: {content[:160]}\n"
+
+        if len(self.history_summary) > self.max_history_summary_chars:
+            self.history_summary = self.history_summary[-self.max_history_summary_chars:]
 
     def reset_conversation(self):
         """Reset conversation history"""
-        self.messages = []
-        logger.debug(f"{self.name} conversation reset")
+        self.messages.clear()
+        self.history_summary = ""
+        logger.debug("%s conversation reset", self.name)
 
     def get_conversation_summary(self) -> str:
         """Get summary of conversation for logging"""
-        return json.dumps(self.messages, indent=2)
+        return orjson.dumps(list(self.messages), option=orjson.OPT_INDENT_2).decode()
 
     def create_result(
         self,
@@ -378,32 +581,34 @@ class BaseAgent(ABC):
 
 
 # Example agent implementation for testing
+EXAMPLE_AGENT_TOOLS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "get_time",
+        "description": "Get current timestamp",
+        "input_schema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+)
+
+
 class ExampleAgent(BaseAgent):
     """Example agent demonstrating base class usage"""
 
+    SYSTEM_PROMPT = """You are an example agent for the Arc Coordination System.
+Your role is to demonstrate how agents work.
+Always respond in JSON format with 'message' and 'status' fields."""
+
     def __init__(self):
         super().__init__(
             name="example_agent",
             description="Example agent for testing base functionality"
         )
 
-    def get_system_prompt(self, context: AgentContext) -> str:
-        return """You are an example agent for the Arc Coordination System.
-Your role is to demonstrate how agents work.
-Always respond in JSON format with 'message' and 'status' fields."""
-
-    def get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "name": "get_time",
-                "description": "Get current timestamp",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            }
-        ]
+    def get_tools(self) -> Tuple[Dict[str, Any], ...]:
+        return EXAMPLE_AGENT_TOOLS
 
     async def execute_tool(
         self,
@@ -443,8 +648,6 @@ Always respond in JSON format with 'message' and 'status' fields."""
 
 # Testing
 if __name__ == "__main__":
-    import asyncio
-
     logging.basicConfig(level=logging.INFO)
 
     async def test_agent():
@@ -12,16 +12,177 @@ Capabilities:
 """
 
 import logging
-import json
-from typing import List, Dict, Any
+import math
+import operator
+import time
+from typing import List, Dict, Any, Optional, ClassVar, Tuple
 from datetime import datetime, timedelta
 import hashlib
+import orjson
 
 from .base_agent import BaseAgent, AgentContext, AgentResult
 from services.llm import ModelPreference
 
+try:
+    from rapidfuzz.distance import Hamming
+except ImportError:  # optional: falls back to a C-level builtin compare
+    Hamming = None
+
 logger = logging.getLogger(__name__)
 
+def _now_ts() -> int:
+    """Current Unix time in whole seconds, without building a datetime"""
+    return time.time_ns() // 1_000_000_000
+
+
+# Price deviation severity, indexed by (>10% from market) + (>20% from market)
+PRICE_SEVERITY = ("none", "high", "critical")
+
+BLOOM_HASHES = 3
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+
+
+class _BloomFilter:
+    """
+    Bit-array Bloom filter used as a negative prefilter for blacklist lookups
+
+    Sized for BLOOM_FALSE_POSITIVE_RATE at the given capacity; index
+    positions are derived from one 16-byte blake2b digest by double hashing.
+    """
+
+    __slots__ = ("bits", "size")
+
+    def __init__(self, items: List[str]):
+        capacity = max(len(items), 1)
+        # m = -k*n / ln(1 - p^(1/k)) for a fixed number of hashes k
+        self.size = max(64, math.ceil(
+            -BLOOM_HASHES * capacity / math.log(1 - BLOOM_FALSE_POSITIVE_RATE ** (1 / BLOOM_HASHES))
+        ))
+        self.bits = bytearray((self.size + 7) // 8)
+        for item in items:
+            for position in self._positions(item):
+                self.bits[position >> 3] |= 1 << (position & 7)
+
+    def _positions(self, item: str):
+        # Two 64-bit halves give all k indices as h1 + i*h2 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(BLOOM_HASHES)]
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+def _build_blacklist(reasons: Dict[str, str]):
+    """Build the (bloom, keys, reasons) blacklist tuple from lowercase addresses"""
+    return (_BloomFilter(list(reasons)), frozenset(reasons), reasons)
+
+
+# Mock blacklist (in production, load from the blacklist database).
+# Keys are lowercase addresses; swapped as one tuple by FraudAgent._reload_blacklist()
+_BLACKLIST_REASONS: Dict[str, str] = {
+    "0xbad1": "Known scammer",
+    "0xbad2": "OFAC sanctioned",
+    "0xbad3": "Previous fraud"
+}
+_BLACKLIST = _build_blacklist(_BLACKLIST_REASONS)
+
+
+# Fraud prompt fragments, formatted and joined by FraudAgent._build_fraud_prompt
+FRAUD_PROMPT_HEADER = """Analyze this intent and its matches for fraud indicators:
+
+INPUT INTENT:
+- ID: {intent.intent_id}
+- Actor: {intent.actor}
+- Type: {intent.intent_type}
+- Asset: {intent.asset}
+- Price: ${intent.price:,.2f}
+- Quantity: {intent.quantity}
+- Timestamp: {intent.timestamp}
+"""
+
+FRAUD_PROMPT_MARKET = """
+MARKET DATA:
+- Current Price: ${current_price:,.2f}
+- Volatility: {volatility}%
+"""
+
+FRAUD_PROMPT_MATCH = """
+Match {number}:
+  - Counterparty: {actor}
+  - Price: ${price:,.2f}
+  - Quantity: {quantity}
+"""
+
+_FRAUD_PROMPT_CHECKS = """
+Use available tools to check for:
+1. Wash trading (same/related actors)
+2. Price manipulation (anomalous prices){price_note}
+3. Blacklist matches
+4. Suspicious timing patterns
+
+Provide comprehensive fraud assessment."""
+
+FRAUD_PROMPT_FOOTER = _FRAUD_PROMPT_CHECKS.format(price_note="")
+FRAUD_PROMPT_FOOTER_SCREENED = _FRAUD_PROMPT_CHECKS.format(
+    price_note=" - already screened above; call check_price_anomaly only to re-check a price"
+)
+
+# Fraud detection tool schemas (immutable, shared by all FraudAgent instances)
+FRAUD_AGENT_TOOLS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "check_wash_trading",
+        "description": "Check if same actor or related actors on both sides",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "actor_a": {"type": "string", "description": "First actor address"},
+                "actor_b": {"type": "string", "description": "Second actor address"}
+            },
+            "required": ["actor_a", "actor_b"]
+        }
+    },
+    {
+        "name": "check_price_anomaly",
+        "description": "Check if price is anomalous compared to market",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "intent_price": {"type": "number", "description": "Intent price"},
+                "market_price": {"type": "number", "description": "Market price"},
+                "asset": {"type": "string", "description": "Asset symbol"}
+            },
+            "required": ["intent_price", "market_price", "asset"]
+        }
+    },
+    {
+        "name": "check_blacklist",
+        "description": "Check if actor is on blacklist",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "actor_address": {"type": "string", "description": "Actor address to check"}
+            },
+            "required": ["actor_address"]
+        }
+    },
+    {
+        "name": "analyze_timing_pattern",
+        "description": "Analyze timing patterns across intents",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "actor_address": {"type": "string", "description": "Actor address"},
+                "lookback_hours": {"type": "number", "description": "Hours to look back"}
+            },
+            "required": ["actor_address"]
+        }
+    }
+)
+
 
 class FraudAgent(BaseAgent):
     """
@@ -41,16 +202,7 @@ class FraudAgent(BaseAgent):
     5. Blacklist Matches: Known bad actors
     """
 
-    def __init__(self):
-        super().__init__(
-            name="fraud_agent",
-            description="Detects suspicious patterns and fraudulent activity",
-            model_preference=ModelPreference.CLAUDE  # Claude for pattern analysis
-        )
-
-    def get_system_prompt(self, context: AgentContext) -> str:
-        """Get system prompt for fraud agent"""
-        return """You are an expert fraud detection agent for the Arc Coordination System.
+    SYSTEM_PROMPT = """You are an expert fraud detection agent for the Arc Coordination System.
 
 Your role is to detect suspicious patterns and prevent fraudulent trades.
 
@@ -122,58 +274,24 @@ You must respond in valid JSON format:
 
 IMPORTANT: Always return valid JSON. Be conservative - false positives are better than missing fraud."""
 
-    def get_tools(self) -> List[Dict[str, Any]]:
+    # Tool name -> (handler method name, whether it takes the context)
+    _TOOL_DISPATCH: ClassVar[Dict[str, Tuple[str, bool]]] = {
+        "check_wash_trading": ("_check_wash_trading", False),
+        "check_price_anomaly": ("_check_price_anomaly", True),
+        "check_blacklist": ("_check_blacklist", False),
+        "analyze_timing_pattern": ("_analyze_timing_pattern", True)
+    }
+
+    def __init__(self):
+        super().__init__(
+            name="fraud_agent",
+            description="Detects suspicious patterns and fraudulent activity",
+            model_preference=ModelPreference.CLAUDE  # Claude for pattern analysis
+        )
+
+    def get_tools(self) -> Tuple[Dict[str, Any], ...]:
         """Get tool definitions for fraud agent"""
-        return [
-            {
-                "name": "check_wash_trading",
-                "description": "Check if same actor or related actors on both sides",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "actor_a": {"type": "string", "description": "First actor address"},
-                        "actor_b": {"type": "string", "description": "Second actor address"}
-                    },
-                    "required": ["actor_a", "actor_b"]
-                }
-            },
-            {
-                "name": "check_price_anomaly",
-                "description": "Check if price is anomalous compared to market",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "intent_price": {"type": "number", "description": "Intent price"},
-                        "market_price": {"type": "number", "description": "Market price"},
-                        "asset": {"type": "string", "description": "Asset symbol"}
-                    },
-                    "required": ["intent_price", "market_price", "asset"]
-                }
-            },
-            {
-                "name": "check_blacklist",
-                "description": "Check if actor is on blacklist",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "actor_address": {"type": "string", "description": "Actor address to check"}
-                    },
-                    "required": ["actor_address"]
-                }
-            },
-            {
-                "name": "analyze_timing_pattern",
-                "description": "Analyze timing patterns across intents",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "actor_address": {"type": "string", "description": "Actor address"},
-                        "lookback_hours": {"type": "number", "description": "Hours to look back"}
-                    },
-                    "required": ["actor_address"]
-                }
-            }
-        ]
+        return FRAUD_AGENT_TOOLS
 
     async def execute_tool(
         self,
@@ -182,19 +300,13 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
         context: AgentContext
     ) -> Dict[str, Any]:
         """Execute fraud detection tools"""
-        if tool_name == "check_wash_trading":
-            return self._check_wash_trading(tool_input)
-
-        elif tool_name == "check_price_anomaly":
-            return self._check_price_anomaly(tool_input, context)
-
-        elif tool_name == "check_blacklist":
-            return self._check_blacklist(tool_input)
+        entry = self._TOOL_DISPATCH.get(tool_name)
+        if entry is None:
+            raise ValueError(f"Unknown tool: {tool_name}")
 
-        elif tool_name == "analyze_timing_pattern":
-            return self._analyze_timing_pattern(tool_input, context)
-
-        raise ValueError(f"Unknown tool: {tool_name}")
+        method_name, takes_context = entry
+        method = getattr(self, method_name)
+        return method(tool_input, context) if takes_context else method(tool_input)
 
     def _check_wash_trading(self, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -213,9 +325,12 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
 
         # Check for similar addresses (mock relationship detection)
         similarity = 0.0
-        if len(actor_a) == len(actor_b):
-            matching_chars = sum(1 for a, b in zip(actor_a, actor_b) if a == b)
-            similarity = matching_chars / len(actor_a)
+        if actor_a and len(actor_a) == len(actor_b):
+            if Hamming is not None:
+                similarity = Hamming.normalized_similarity(actor_a, actor_b)
+            else:
+                # map(operator.eq) compares characters in C, not in a generator
+                similarity = sum(map(operator.eq, actor_a, actor_b)) / len(actor_a)
 
         # High similarity might indicate related wallets
         is_related = similarity > 0.9 and not is_same
@@ -229,6 +344,21 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
             "wash_trading_risk": "critical" if is_same else "high" if is_related else "none"
         }
 
+    def _check_wash_trading_batch(self, pairs: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Check several (actor_a, actor_b) pairs for wash trading
+
+        Args:
+            pairs: Actor address pairs, e.g. (intent actor, match counterparty)
+
+        Returns:
+            One wash trading result per pair, in input order
+        """
+        return [
+            self._check_wash_trading({"actor_a": actor_a, "actor_b": actor_b})
+            for actor_a, actor_b in pairs
+        ]
+
     def _check_price_anomaly(
         self,
         tool_input: Dict[str, Any],
@@ -253,16 +383,10 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
         deviation = abs(intent_price - market_price)
         deviation_pct = (deviation / market_price) * 100
 
-        # Thresholds
-        is_anomalous = deviation_pct > 10  # >10% from market
-        is_suspicious = deviation_pct > 20  # >20% is very suspicious
-
-        if is_suspicious:
-            severity = "critical"
-        elif is_anomalous:
-            severity = "high"
-        else:
-            severity = "none"
+        # Thresholds: >10% from market is anomalous, >20% is very suspicious
+        is_anomalous = deviation_pct > 10
+        is_suspicious = deviation_pct > 20
+        severity = PRICE_SEVERITY[is_anomalous + is_suspicious]
 
         return {
             "asset": asset,
@@ -272,10 +396,35 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
             "deviation_pct": round(deviation_pct, 2),
             "anomalous": is_anomalous,
             "severity": severity,
-            "threshold_10pct": deviation_pct > 10,
-            "threshold_20pct": deviation_pct > 20
+            "threshold_10pct": is_anomalous,
+            "threshold_20pct": is_suspicious
         }
 
+    def _check_price_anomaly_batch(
+        self,
+        prices: List[float],
+        market_price: float
+    ) -> List[tuple]:
+        """
+        Screen several prices against one market price
+
+        Args:
+            prices: Intent or settlement prices
+            market_price: Market price
+
+        Returns:
+            (deviation_pct, severity) per price, in input order
+        """
+        if market_price == 0:
+            return [(0.0, "none")] * len(prices)
+
+        scale = 100 / market_price
+        results = []
+        for price in prices:
+            deviation_pct = abs(price - market_price) * scale
+            results.append((deviation_pct, PRICE_SEVERITY[(deviation_pct > 10) + (deviation_pct > 20)]))
+        return results
+
     def _check_blacklist(self, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """
         Check blacklist
@@ -287,24 +436,32 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
         """
         actor_address = tool_input["actor_address"]
 
-        # Mock blacklist (in production, query real database)
-        blacklisted_addresses = {
-            "0xBAD1": "Known scammer",
-            "0xBAD2": "OFAC sanctioned",
-            "0xBAD3": "Previous fraud"
-        }
-
-        is_blacklisted = actor_address in blacklisted_addresses
-        reason = blacklisted_addresses.get(actor_address, None)
+        blacklist_bloom, blacklist_keys, blacklist_reasons = _BLACKLIST
+        address = actor_address.lower()
+        # Most addresses are rejected by the Bloom filter without a set probe
+        is_blacklisted = address in blacklist_bloom and address in blacklist_keys
+        reason = blacklist_reasons[address] if is_blacklisted else None
 
         return {
             "actor_address": actor_address,
             "is_blacklisted": is_blacklisted,
             "reason": reason,
             "risk_level": "critical" if is_blacklisted else "none",
-            "last_checked": int(datetime.now().timestamp())
+            "last_checked": _now_ts()
         }
 
+    @classmethod
+    def _reload_blacklist(cls, reasons: Dict[str, str]):
+        """
+        Replace the blacklist
+
+        Args:
+            reasons: Blacklist reason keyed by actor address
+        """
+        global _BLACKLIST
+        normalized = {address.lower(): reason for address, reason in reasons.items()}
+        _BLACKLIST = _build_blacklist(normalized)
+
     def _analyze_timing_pattern(
         self,
         tool_input: Dict[str, Any],
@@ -319,13 +476,10 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
         lookback_hours = tool_input.get("lookback_hours", 24)
 
         # Find actor's recent intents
-        now = int(datetime.now().timestamp())
+        now = _now_ts()
         cutoff = now - (lookback_hours * 3600)
 
-        actor_intents = [
-            i for i in context.available_intents
-            if i.actor == actor_address and i.timestamp >= cutoff
-        ]
+        timestamps, actor_intents = context.actor_timeline(actor_address, since=cutoff)
 
         if len(actor_intents) < 2:
             return {
@@ -335,19 +489,11 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
                 "pattern": "insufficient_data"
             }
 
-        # Sort by timestamp
-        sorted_intents = sorted(actor_intents, key=lambda x: x.timestamp)
-
-        # Check for very rapid orders
-        rapid_orders = 0
-        for i in range(len(sorted_intents) - 1):
-            time_diff = sorted_intents[i + 1].timestamp - sorted_intents[i].timestamp
-            if time_diff < 60:  # Less than 1 minute apart
-                rapid_orders += 1
+        # Check for very rapid orders (less than 1 minute apart)
+        rapid_orders = sum(later - earlier < 60 for earlier, later in zip(timestamps, timestamps[1:]))
 
         # Check for identical quantities (bot pattern)
-        quantities = [i.quantity for i in sorted_intents]
-        identical_quantities = len(set(quantities)) == 1 and len(quantities) > 2
+        identical_quantities = len(actor_intents) > 2 and len({i.quantity for i in actor_intents}) == 1
 
         suspicious = rapid_orders > 2 or identical_quantities
 
@@ -388,6 +534,12 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
             if matching_result:
                 matches = matching_result.output.get("matches", [])
 
+            # Terminal findings need no model reasoning: block without calling the LLM
+            blocked = self._precheck_block(input_intent, matches, context)
+            if blocked is not None:
+                logger.info(f"Fraud check: blocked {input_intent.intent_id} by pre-check")
+                return blocked
+
             # Get market data for price anomaly check
             market_data = None
             market_result = context.previous_results.get("market_agent")
@@ -452,6 +604,66 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
                 error=str(e)
             )
 
+    def _precheck_block(
+        self,
+        input_intent: Any,
+        matches: List[Dict],
+        context: AgentContext
+    ) -> Optional[AgentResult]:
+        """
+        Run the deterministic blacklist and self-trade checks
+
+        Returns:
+            A blocking AgentResult if either check is critical, else None
+        """
+        flags = []
+        blacklist = self._check_blacklist({"actor_address": input_intent.actor})
+        if blacklist["is_blacklisted"]:
+            flags.append({
+                "category": "blacklist_matches",
+                "severity": "critical",
+                "description": f"Blacklisted actor {input_intent.actor}: {blacklist['reason']}"
+            })
+
+        match_ids = {match.get('intent_b_id') for match in matches}
+        if match_ids:
+            counterparties = [
+                intent for intent in context.available_intents if intent.intent_id in match_ids
+            ]
+            wash_results = self._check_wash_trading_batch(
+                [(input_intent.actor, intent.actor) for intent in counterparties]
+            )
+            for intent, wash in zip(counterparties, wash_results):
+                if wash["is_same_actor"]:
+                    flags.append({
+                        "category": "wash_trading",
+                        "severity": "critical",
+                        "description": f"Same actor on both sides of match with {intent.intent_id}"
+                    })
+                    break
+
+        if not flags:
+            return None
+
+        reasoning = "; ".join(flag["description"] for flag in flags)
+        return self.create_result(
+            success=True,
+            output={
+                "fraud_check": {
+                    "fraud_score": 100,
+                    "risk_level": "critical",
+                    "flags": flags,
+                    "wash_trading_detected": any(flag["category"] == "wash_trading" for flag in flags),
+                    "price_manipulation_detected": False,
+                    "blacklist_match": blacklist["is_blacklisted"]
+                },
+                "decision": "block",
+                "reasoning": reasoning
+            },
+            confidence=1.0,
+            reasoning=reasoning
+        )
+
     def _build_fraud_prompt(
         self,
         input_intent: Any,
@@ -459,28 +671,19 @@ IMPORTANT: Always return valid JSON. Be conservative - false positives are bette
         context: AgentContext,
         market_data: Dict = None
     ) -> str:
-        """Build prompt for fraud detection"""
-        prompt = f"""Analyze this intent and its matches for fraud indicators:
-
-INPUT INTENT:
-- ID: {input_intent.intent_id}
-- Actor: {input_intent.actor}
-- Type: {input_intent.intent_type}
-- Asset: {input_intent.asset}
-- Price: ${input_intent.price:,.2f}
-- Quantity: {input_intent.quantity}
-- Timestamp: {input_intent.timestamp}
-"""
+        """Build prompt for fraud detection from the module-level templates"""
+        parts = [FRAUD_PROMPT_HEADER.format(intent=input_intent)]
 
+        market_price = 0
         if market_data:
-            prompt += f"""
-MARKET DATA:
-- Current Price: ${market_data.get('current_price', 0):,.2f}
-- Volatility: {market_data.get('volatility', 0)}%
-"""
+            market_price = market_data.get('current_price', 0)
+            parts.append(FRAUD_PROMPT_MARKET.format(
+                current_price=market_price,
+                volatility=market_data.get('volatility', 0)
+            ))
 
         if matches:
-            prompt += f"\n POTENTIAL MATCHES: {len(matches)}\n"
+            parts.append(f"\n POTENTIAL MATCHES: {len(matches)}\n")
             for i, match in enumerate(matches[:3]):
                 # Find the matching intent
                 match_intent_id = match.get('intent_b_id')
@@ -489,34 +692,39 @@ MARKET DATA:
                     None
                 )
                 if match_intent:
-                    prompt += f"""
-Match {i+1}:
-  - Counterparty: {match_intent.actor}
-  - Price: ${match['settlement_price']:,.2f}
-  - Quantity: {match['settlement_quantity']}
-"""
-
-        prompt += """
-Use available tools to check for:
-1. Wash trading (same/related actors)
-2. Price manipulation (anomalous prices)
-3. Blacklist matches
-4. Suspicious timing patterns
-
-Provide comprehensive fraud assessment."""
+                    parts.append(FRAUD_PROMPT_MATCH.format(
+                        number=i + 1,
+                        actor=match_intent.actor,
+                        price=match['settlement_price'],
+                        quantity=match['settlement_quantity']
+                    ))
+
+        price_screened = bool(matches) and market_price > 0
+        if price_screened:
+            # Screen every match price in one pass instead of one tool call per match
+            screen = self._check_price_anomaly_batch(
+                [match['settlement_price'] for match in matches],
+                market_price
+            )
+            parts.append("\nPRICE SCREEN (deviation from market, all matches):\n")
+            parts.extend(
+                f"  - {match.get('intent_b_id')}: {deviation_pct:.2f}% ({severity})\n"
+                for match, (deviation_pct, severity) in zip(matches, screen)
+            )
 
-        return prompt
+        parts.append(FRAUD_PROMPT_FOOTER_SCREENED if price_screened else FRAUD_PROMPT_FOOTER)
+        return "".join(parts)
 
     def _format_tool_results(self, tool_results: List[Dict[str, Any]]) -> str:
-        """Format tool results"""
-        results_str = "Fraud detection results:\n"
+        """Format tool results as compact JSON lines"""
+        parts = ["Fraud detection results:\n"]
         for result in tool_results:
             if result["success"]:
-                results_str += f"- {result['tool_name']}: {json.dumps(result['result'], indent=2)}\n"
+                parts.append(f"- {result['tool_name']}: {orjson.dumps(result['result']).decode()}\n")
             else:
-                results_str += f"- {result['tool_name']}: Error - {result['error']}\n"
-        results_str += "\nProvide final fraud assessment in JSON format."
-        return results_str
+                parts.append(f"- {result['tool_name']}: Error - {result['error']}\n")
+        parts.append("\nProvide final fraud assessment in JSON format.")
+        return "".join(parts)
 
 
 # Testing
@@ -11,17 +11,123 @@ Capabilities:
 - Inventory management
 """
 
+import bisect
 import logging
-import json
-from typing import List, Dict, Any
-from datetime import datetime
+from array import array
+from typing import List, Dict, Any, Tuple
 import random
+import time
+import orjson
 
 from .base_agent import BaseAgent, AgentContext, AgentResult
 from services.llm import ModelPreference
 
 logger = logging.getLogger(__name__)
 
+# Mock inventory source: one generator seeded once, independent of the global random state
+_INVENTORY_RNG = random.Random()
+
+class InventoryBook:
+    """
+    Per-asset inventory parameters stored as parallel columns
+
+    Targets and position limits live in contiguous float arrays indexed
+    through asset_idx, rather than one dict per asset. Each asset gets a
+    neutral target and the default limit on first use.
+    """
+
+    __slots__ = ("asset_idx", "targets", "limits", "default_limit")
+
+    def __init__(self, default_limit: float = 10.0):
+        self.asset_idx: Dict[str, int] = {}
+        self.targets = array("d")
+        self.limits = array("d")
+        self.default_limit = default_limit
+
+    def index(self, asset: str) -> int:
+        """Column index for an asset, adding it with defaults if unseen"""
+        idx = self.asset_idx.get(asset)
+        if idx is None:
+            idx = self.asset_idx[asset] = len(self.targets)
+            self.targets.append(0.0)  # Market maker wants neutral
+            self.limits.append(self.default_limit)
+        return idx
+
+
+# Shared inventory parameters for all LiquidityAgent instances
+INVENTORY_BOOK = InventoryBook()
+
+# Minimum profitable spread, in percent
+BASE_SPREAD_PCT = 0.3
+
+# Volatility premium tiers: premium[i] applies from threshold[i - 1] up to threshold[i]
+VOLATILITY_THRESHOLDS = (2.0, 5.0)
+VOLATILITY_PREMIUMS = (0.2, 0.5, 1.0)
+
+
+def _spread_core(volatility: float, inventory_skew: float) -> Tuple[float, float, float]:
+    """
+    Spread = Base Spread + Volatility Premium + Inventory Adjustment
+
+    Returns:
+        (total spread %, volatility premium %, inventory adjustment %)
+    """
+    vol_premium = VOLATILITY_PREMIUMS[bisect.bisect_right(VOLATILITY_THRESHOLDS, volatility)]
+
+    # Up to 0.5% for max skew
+    inventory_adjustment = abs(inventory_skew) * 0.5
+
+    return BASE_SPREAD_PCT + vol_premium + inventory_adjustment, vol_premium, inventory_adjustment
+
+
+# Liquidity tool schemas (immutable, shared by all LiquidityAgent instances)
+LIQUIDITY_AGENT_TOOLS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "calculate_quote",
+        "description": "Calculate market maker quote for an asset",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "asset": {"type": "string", "description": "Asset symbol"},
+                "intent_type": {"type": "string", "description": "Original intent type: bid or ask"},
+                "quantity": {"type": "number", "description": "Desired quantity"},
+                "market_price": {"type": "number", "description": "Current market price"}
+            },
+            "required": ["asset", "intent_type", "quantity", "market_price"]
+        }
+    },
+    {
+        "name": "assess_inventory",
+        "description": "Assess current inventory position",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "asset": {"type": "string", "description": "Asset symbol"}
+            },
+            "required": ["asset"]
+        }
+    },
+    {
+        "name": "calculate_spread",
+        "description": "Calculate optimal spread based on volatility and inventory",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "asset": {"type": "string", "description": "Asset symbol"},
+                "volatility": {"type": "number", "description": "Volatility percentage"},
+                "inventory_skew": {"type": "number", "description": "Inventory skew (-1 to 1)"}
+            },
+            "required": ["asset", "volatility"]
+        }
+    }
+)
+
+
+def _has_natural_match(context: AgentContext) -> bool:
+    """True when the matching agent already paired the intent, so no quote is needed"""
+    matching_result = context.previous_results.get("matching_agent")
+    return bool(matching_result and matching_result.output.get("matches"))
+
 
 class LiquidityAgent(BaseAgent):
     """
@@ -41,16 +147,7 @@ class LiquidityAgent(BaseAgent):
     5. Monitor and adjust
     """
 
-    def __init__(self):
-        super().__init__(
-            name="liquidity_agent",
-            description="Provides market making and liquidity",
-            model_preference=ModelPreference.GEMINI  # Gemini for portfolio analysis
-        )
-
-    def get_system_prompt(self, context: AgentContext) -> str:
-        """Get system prompt for liquidity agent"""
-        return """You are an expert market making agent for the Arc Coordination System.
+    SYSTEM_PROMPT = """You are an expert market making agent for the Arc Coordination System.
 
 Your role is to provide liquidity when no natural matches exist between intents.
 
@@ -116,48 +213,16 @@ QUOTE STRUCTURE:
 
 IMPORTANT: Always return valid JSON. Quotes must be executable."""
 
-    def get_tools(self) -> List[Dict[str, Any]]:
+    def __init__(self):
+        super().__init__(
+            name="liquidity_agent",
+            description="Provides market making and liquidity",
+            model_preference=ModelPreference.GEMINI  # Gemini for portfolio analysis
+        )
+
+    def get_tools(self) -> Tuple[Dict[str, Any], ...]:
         """Get tool definitions for liquidity agent"""
-        return [
-            {
-                "name": "calculate_quote",
-                "description": "Calculate market maker quote for an asset",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "asset": {"type": "string", "description": "Asset symbol"},
-                        "intent_type": {"type": "string", "description": "Original intent type: bid or ask"},
-                        "quantity": {"type": "number", "description": "Desired quantity"},
-                        "market_price": {"type": "number", "description": "Current market price"}
-                    },
-                    "required": ["asset", "intent_type", "quantity", "market_price"]
-                }
-            },
-            {
-                "name": "assess_inventory",
-                "description": "Assess current inventory position",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "asset": {"type": "string", "description": "Asset symbol"}
-                    },
-                    "required": ["asset"]
-                }
-            },
-            {
-                "name": "calculate_spread",
-                "description": "Calculate optimal spread based on volatility and inventory",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "asset": {"type": "string", "description": "Asset symbol"},
-                        "volatility": {"type": "number", "description": "Volatility percentage"},
-                        "inventory_skew": {"type": "number", "description": "Inventory skew (-1 to 1)"}
-                    },
-                    "required": ["asset", "volatility"]
-                }
-            }
-        ]
+        return LIQUIDITY_AGENT_TOOLS
 
     async def execute_tool(
         self,
@@ -191,59 +256,73 @@ IMPORTANT: Always return valid JSON. Quotes must be executable."""
         - Calculate risk metrics
         - Generate executable quote
         """
-        asset = tool_input["asset"]
-        intent_type = tool_input["intent_type"]
-        quantity = tool_input["quantity"]
-        market_price = tool_input["market_price"]
+        return self._calculate_quotes_batch([tool_input], context)[0]
 
-        # Get inventory
-        inventory = self._assess_inventory({"asset": asset}, context)
-        inventory_skew = inventory["skew_pct"] / 100  # -1 to 1
+    def _calculate_quotes_batch(
+        self,
+        quote_inputs: List[Dict[str, Any]],
+        context: AgentContext
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate market maker quotes for several assets in one pass
+
+        Volatility and the quote expiry are resolved once for the whole
+        batch; each quote then only runs the inventory and spread math.
+
+        Args:
+            quote_inputs: calculate_quote tool inputs (asset, intent_type, quantity, market_price)
+            context: Agent context
 
+        Returns:
+            One quote per input, in input order
+        """
         # Get volatility from context
         volatility = 2.5  # Default
         market_result = context.previous_results.get("market_agent")
         if market_result and market_result.output.get("market_data"):
             volatility = market_result.output["market_data"].get("volatility", 2.5)
 
-        # Calculate spread
-        spread_result = self._calculate_spread({
-            "asset": asset,
-            "volatility": volatility,
-            "inventory_skew": inventory_skew
-        })
-
-        spread_pct = spread_result["spread_pct"]
-        half_spread = market_price * (spread_pct / 200)  # Half spread on each side
-
-        # Generate two-sided quote
-        bid_price = market_price - half_spread
-        ask_price = market_price + half_spread
-
-        # Adjust for inventory skew
-        if inventory_skew > 0:  # Long position, want to sell
-            bid_price -= market_price * 0.001  # Reduce bid
-            ask_price -= market_price * 0.001  # Reduce ask (more competitive)
-        elif inventory_skew < 0:  # Short position, want to buy
-            bid_price += market_price * 0.001  # Increase bid (more competitive)
-            ask_price += market_price * 0.001  # Increase ask
-
         # Valid for 5 minutes
-        valid_until = int(datetime.now().timestamp()) + 300
-
-        return {
-            "asset": asset,
-            "market_price": market_price,
-            "bid_price": round(bid_price, 2),
-            "ask_price": round(ask_price, 2),
-            "bid_quantity": quantity,
-            "ask_quantity": quantity,
-            "spread_bps": int(spread_pct * 100),
-            "mid_price": market_price,
-            "valid_until": valid_until,
-            "inventory_adjusted": abs(inventory_skew) > 0.05,
-            "quote_type": "two_sided"
-        }
+        valid_until = int(time.time()) + 300
+
+        quotes = []
+        for tool_input in quote_inputs:
+            asset = tool_input["asset"]
+            quantity = tool_input["quantity"]
+            market_price = tool_input["market_price"]
+
+            # Get inventory
+            inventory = self._assess_inventory({"asset": asset}, context)
+            inventory_skew = inventory["skew_norm"]
+
+            # Calculate spread (rounded as the calculate_spread tool reports it)
+            spread_pct = round(_spread_core(volatility, inventory_skew)[0], 3)
+            half_spread = market_price * (spread_pct / 200)  # Half spread on each side
+
+            # Shift both sides 0.1% against the inventory skew: long lowers the
+            # quote to sell, short raises it to buy, neutral leaves it centered
+            skew_shift = ((inventory_skew < 0) - (inventory_skew > 0)) * market_price * 0.001
+
+            # Generate two-sided quote in integer cents (prices are positive,
+            # so +0.5 and truncation rounds half up)
+            bid_cents = int((market_price - half_spread + skew_shift) * 100 + 0.5)
+            ask_cents = int((market_price + half_spread + skew_shift) * 100 + 0.5)
+
+            quotes.append({
+                "asset": asset,
+                "market_price": market_price,
+                "bid_price": bid_cents / 100,
+                "ask_price": ask_cents / 100,
+                "bid_quantity": quantity,
+                "ask_quantity": quantity,
+                "spread_bps": int(spread_pct * 100),
+                "mid_price": market_price,
+                "valid_until": valid_until,
+                "inventory_adjusted": abs(inventory_skew) > 0.05,
+                "quote_type": "two_sided"
+            })
+
+        return quotes
 
     def _assess_inventory(
         self,
@@ -260,28 +339,37 @@ IMPORTANT: Always return valid JSON. Quotes must be executable."""
         """
         asset = tool_input["asset"]
 
+        # Positions are fixed for the request; quote and tool calls share one read
+        cached = context.tool_cache.get(("inventory", asset))
+        if cached is not None:
+            return cached
+
         # Mock inventory (in production, query real positions)
         # Simulate random inventory between -10 and +10 units
-        current_position = random.uniform(-5, 5)
-        target_position = 0.0  # Market maker wants neutral
+        current_position = _INVENTORY_RNG.uniform(-5, 5)
+        idx = INVENTORY_BOOK.index(asset)
+        target_position = INVENTORY_BOOK.targets[idx]
+        position_limit = INVENTORY_BOOK.limits[idx]
 
         skew = current_position - target_position
-        skew_pct = (skew / 10) * 100 if abs(skew) > 0 else 0  # -100 to +100
+        skew_norm = skew / position_limit  # -1 to +1
 
-        position_limit = 10.0
         utilization_pct = (abs(current_position) / position_limit) * 100
 
-        return {
+        inventory = {
             "asset": asset,
             "current_position": round(current_position, 4),
             "target_position": target_position,
             "skew": round(skew, 4),
-            "skew_pct": round(skew_pct, 2),
+            "skew_norm": skew_norm,
+            "skew_pct": round(skew_norm * 100, 2),
             "position_limit": position_limit,
             "utilization_pct": round(utilization_pct, 2),
-            "needs_rebalancing": abs(skew_pct) > 10,
+            "needs_rebalancing": abs(skew_norm) > 0.1,
             "risk_level": "high" if utilization_pct > 80 else "medium" if utilization_pct > 50 else "low"
         }
+        context.tool_cache[("inventory", asset)] = inventory
+        return inventory
 
     def _calculate_spread(self, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -290,30 +378,15 @@ IMPORTANT: Always return valid JSON. Quotes must be executable."""
         Spread = Base Spread + Volatility Premium + Inventory Adjustment
         """
         asset = tool_input["asset"]
-        volatility = tool_input["volatility"]
-        inventory_skew = tool_input.get("inventory_skew", 0.0)
-
-        # Base spread (minimum profitable spread)
-        base_spread_pct = 0.3
-
-        # Volatility premium
-        if volatility < 2:
-            vol_premium = 0.2
-        elif volatility < 5:
-            vol_premium = 0.5
-        else:
-            vol_premium = 1.0
-
-        # Inventory adjustment
-        inventory_adjustment = abs(inventory_skew) * 0.5  # Up to 0.5% for max skew
-
-        # Total spread
-        total_spread_pct = base_spread_pct + vol_premium + inventory_adjustment
+        total_spread_pct, vol_premium, inventory_adjustment = _spread_core(
+            tool_input["volatility"],
+            tool_input.get("inventory_skew", 0.0)
+        )
 
         return {
             "asset": asset,
             "spread_pct": round(total_spread_pct, 3),
-            "base_spread": base_spread_pct,
+            "base_spread": BASE_SPREAD_PCT,
             "volatility_premium": vol_premium,
             "inventory_adjustment": round(inventory_adjustment, 3),
             "spread_bps": int(total_spread_pct * 100),
@@ -339,6 +412,16 @@ IMPORTANT: Always return valid JSON. Quotes must be executable."""
                     error="No input intent provided"
                 )
 
+            # A natural counterparty exists: skip the LLM round trip entirely
+            if _has_natural_match(context):
+                logger.info(f"Liquidity agent skipped for intent {input_intent.intent_id}: natural match exists")
+                return self.create_result(
+                    success=True,
+                    output={"skipped": "natural_match_exists"},
+                    reasoning="Natural match exists; no liquidity quote needed",
+                    next_agent=None
+                )
+
             logger.info(f"Liquidity agent providing quote for intent {input_intent.intent_id}")
 
             # Get market data
@@ -347,27 +430,23 @@ IMPORTANT: Always return valid JSON. Quotes must be executable."""
             if market_result and market_result.output.get("market_data"):
                 market_price = market_result.output["market_data"].get("current_price", input_intent.price)
 
+            # The quote tools are deterministic local math: run them up front
+            # and hand the results to a single LLM call
+            tool_results = self._precompute_tool_results(input_intent, market_price, context)
+
             # Build liquidity prompt
-            prompt = self._build_liquidity_prompt(input_intent, market_price, context)
+            prompt = "\n\n".join((
+                self._build_liquidity_prompt(input_intent, market_price, context),
+                self._format_tool_results(tool_results)
+            ))
 
-            # Call LLM with tools
             response = await self.call_llm(
                 prompt=prompt,
                 context=context,
-                use_tools=True,
+                use_tools=False,
                 temperature=0.4  # Moderate creativity for pricing
             )
 
-            # Handle tool calls
-            if response.get("stop_reason") == "tool_use":
-                tool_results = await self.handle_tool_calls(response, context)
-                tool_result_message = self._format_tool_results(tool_results)
-                response = await self.call_llm(
-                    prompt=tool_result_message,
-                    context=context,
-                    use_tools=False
-                )
-
             # Parse liquidity quote
             output = self.parse_json_output(response)
 
@@ -398,6 +477,44 @@ IMPORTANT: Always return valid JSON. Quotes must be executable."""
                 error=str(e)
             )
 
+    def _precompute_tool_results(
+        self,
+        input_intent: Any,
+        market_price: float,
+        context: AgentContext
+    ) -> List[Dict[str, Any]]:
+        """
+        Run inventory, spread and quote tools for the intent
+
+        Returns:
+            Results shaped like handle_tool_calls output
+        """
+        asset = input_intent.asset
+
+        volatility = 2.5  # Default
+        market_result = context.previous_results.get("market_agent")
+        if market_result and market_result.output.get("market_data"):
+            volatility = market_result.output["market_data"].get("volatility", 2.5)
+
+        inventory = self._assess_inventory({"asset": asset}, context)
+        spread = self._calculate_spread({
+            "asset": asset,
+            "volatility": volatility,
+            "inventory_skew": inventory["skew_norm"]
+        })
+        quote = self._calculate_quote({
+            "asset": asset,
+            "intent_type": input_intent.intent_type,
+            "quantity": input_intent.quantity,
+            "market_price": market_price
+        }, context)
+
+        return [
+            {"tool_name": "assess_inventory", "result": inventory, "success": True},
+            {"tool_name": "calculate_spread", "result": spread, "success": True},
+            {"tool_name": "calculate_quote", "result": quote, "success": True}
+        ]
+
     def _build_liquidity_prompt(
         self,
         input_intent: Any,
@@ -405,7 +522,7 @@ IMPORTANT: Always return valid JSON. Quotes must be executable."""
         context: AgentContext
     ) -> str:
         """Build prompt for liquidity quote"""
-        prompt = f"""Generate a market maker quote for this unmatched intent:
+        parts = [f"""Generate a market maker quote for this unmatched intent:
 
 INPUT INTENT (No Natural Match Found):
 - Type: {input_intent.intent_type}
@@ -413,43 +530,40 @@ INPUT INTENT (No Natural Match Found):
 - Quantity: {input_intent.quantity}
 - User Price: ${input_intent.price:,.2f}
 - Market Price: ${market_price:,.2f}
-"""
+"""]
 
         # Add market data if available
         market_result = context.previous_results.get("market_agent")
         if market_result and market_result.output.get("market_data"):
             market_data = market_result.output["market_data"]
-            prompt += f"""
+            parts.append(f"""
 MARKET CONDITIONS:
 - Volatility: {market_data.get('volatility', 0)}%
 - Sentiment: {market_data.get('market_sentiment', 'neutral')}
 - Bid-Ask Spread: {market_data.get('bid_ask_spread', 0)}%
-"""
+""")
 
-        prompt += f"""
+        parts.append(f"""
 LIQUIDITY PROVIDER INFO:
 - Total intents in pool: {len(context.available_intents)}
-- Active {input_intent.asset} intents: {sum(1 for i in context.available_intents if i.asset == input_intent.asset and i.is_active)}
+- Active {input_intent.asset} intents: {context.active_intent_count(input_intent.asset)}
 
-Use available tools to:
-1. Assess inventory position
-2. Calculate optimal spread
-3. Generate two-sided quote
+Inventory, spread and two-sided quote analysis follows.
 
-Provide a competitive quote that balances profit with execution probability."""
+Provide a competitive quote that balances profit with execution probability.""")
 
-        return prompt
+        return "".join(parts)
 
     def _format_tool_results(self, tool_results: List[Dict[str, Any]]) -> str:
-        """Format tool results"""
-        results_str = "Market making analysis:\n"
+        """Format tool results as compact JSON lines"""
+        parts = ["Market making analysis:\n"]
         for result in tool_results:
             if result["success"]:
-                results_str += f"- {result['tool_name']}: {json.dumps(result['result'], indent=2)}\n"
+                parts.append(f"- {result['tool_name']}: {orjson.dumps(result['result']).decode()}\n")
             else:
-                results_str += f"- {result['tool_name']}: Error - {result['error']}\n"
-        results_str += "\nProvide final liquidity quote in JSON format."
-        return results_str
+                parts.append(f"- {result['tool_name']}: Error - {result['error']}\n")
+        parts.append("\nProvide final liquidity quote in JSON format.")
+        return "".join(parts)
 
 
 # Testing
@@ -463,6 +577,7 @@ if __name__ == "__main__":
         """Test liquidity agent"""
         print("\n=== Testing Liquidity Agent ===\n")
 
+        now_s = time.time_ns() // 1_000_000_000
         intent = IntentData(
             intent_id="0xTEST",
             intent_hash="0xhash",
@@ -472,8 +587,8 @@ if __name__ == "__main__":
             quantity=1.0,
             asset="BTC",
             settlement_asset="USD",
-            timestamp=int(datetime.now().timestamp()),
-            valid_until=int(datetime.now().timestamp()) + 86400,
+            timestamp=now_s,
+            valid_until=now_s + 86400,
             ap2_mandate_id="0xMandate",
             is_active=True
         )
@@ -12,10 +12,12 @@ Capabilities:
 """
 
 import logging
-import json
-from typing import List, Dict, Any
+import math
+from typing import List, Dict, Any, Sequence, Tuple
 from datetime import datetime, timedelta
 import random
+import time
+import orjson
 
 from .base_agent import BaseAgent, AgentContext, AgentResult
 from services.llm import ModelPreference
@@ -24,6 +26,93 @@ from services.langgraph.state import MarketData
 logger = logging.getLogger(__name__)
 
 
+# Mock market data used until real price feeds are wired in
+MOCK_PRICES = {
+    "BTC": 10050.0,
+    "ETH": 1800.0,
+    "USDC": 1.0,
+    "USD": 1.0
+}
+BASE_VOLATILITY = {
+    "BTC": 2.5,
+    "ETH": 3.5,
+    "USDC": 0.1,
+    "USD": 0.0
+}
+
+
+def _now_ts() -> int:
+    """Current Unix time in whole seconds, without building a datetime"""
+    return time.time_ns() // 1_000_000_000
+
+
+def _volatility_stats(prices: Sequence[float]) -> Tuple[float, float]:
+    """
+    Volatility and Bollinger band width from a price series, in one pass
+
+    Welford's online update keeps the running mean and sum of squared
+    deviations for both the period returns and the prices, so the
+    history is walked once with no intermediate lists.
+
+    Args:
+        prices: Price history, oldest first (at least 3 points)
+
+    Returns:
+        (sample std of period returns in %, 2-sigma band width as % of mean price)
+    """
+    ret_mean = ret_m2 = price_m2 = 0.0
+    price_mean = previous = prices[0]
+    for n, price in enumerate(prices[1:], start=1):
+        # Returns: n-th sample
+        ret = price / previous - 1.0
+        delta = ret - ret_mean
+        ret_mean += delta / n
+        ret_m2 += delta * (ret - ret_mean)
+        # Prices: (n+1)-th sample
+        delta = price - price_mean
+        price_mean += delta / (n + 1)
+        price_m2 += delta * (price - price_mean)
+        previous = price
+
+    count = len(prices)
+    ret_std = (ret_m2 / (count - 2)) ** 0.5
+    price_std = (price_m2 / (count - 1)) ** 0.5
+    return ret_std * 100, (4 * price_std / price_mean) * 100 if price_mean else 0.0
+
+
+# Corwin-Schultz constants and the number of recent bars the spread estimate uses
+_CS_DENOM = 3 - 2 * math.sqrt(2)
+SPREAD_ESTIMATE_BARS = 30
+
+
+def _estimate_spread_cs(highs: Sequence[float], lows: Sequence[float]) -> float:
+    """
+    Corwin-Schultz bid-ask spread estimate from high/low bars
+
+    Each pair of consecutive bars gives a spread estimate from how the
+    two-bar high/low range compares with the single-bar ranges; negative
+    pair estimates are set to zero before averaging.
+
+    Args:
+        highs: Bar highs, oldest first
+        lows: Bar lows, same length as highs
+
+    Returns:
+        Estimated proportional spread (0.01 = 1%)
+    """
+    total = 0.0
+    pairs = len(highs) - 1
+    for t in range(pairs):
+        h0, h1, l0, l1 = highs[t], highs[t + 1], lows[t], lows[t + 1]
+        beta = math.log(h0 / l0) ** 2 + math.log(h1 / l1) ** 2
+        gamma = math.log(max(h0, h1) / min(l0, l1)) ** 2
+        alpha = (math.sqrt(2 * beta) - math.sqrt(beta)) / _CS_DENOM - math.sqrt(gamma / _CS_DENOM)
+        if alpha > 0:
+            e_alpha = math.exp(alpha)
+            total += 2 * (e_alpha - 1) / (1 + e_alpha)
+    return total / pairs if pairs > 0 else 0.0
+
+
 class MarketAgent(BaseAgent):
     """
     Market analysis agent
@@ -172,38 +261,32 @@ IMPORTANT: Always return valid JSON. No markdown, no code blocks, just pure JSON
         """
         asset = tool_input["asset"]
 
-        # Get prices from available intents
-        prices = []
-        for intent in context.available_intents:
-            if intent.asset == asset and intent.is_active:
-                prices.append(intent.price)
+        # Get prices from the active intent columns
+        bid_prices = context.intent_columns("bid", asset)[0]
+        ask_prices = context.intent_columns("ask", asset)[0]
+        sample_size = len(bid_prices) + len(ask_prices)
 
-        if not prices:
+        if not sample_size:
             # Fallback to mock data
-            mock_prices = {
-                "BTC": 10050.0,
-                "ETH": 1800.0,
-                "USDC": 1.0,
-                "USD": 1.0
-            }
             return {
                 "asset": asset,
-                "price": mock_prices.get(asset, 0),
+                "price": MOCK_PRICES.get(asset, 0),
                 "source": "mock",
-                "timestamp": int(datetime.now().timestamp())
+                "timestamp": _now_ts()
             }
 
-        # Calculate average from active intents
-        avg_price = sum(prices) / len(prices)
+        # Aggregate each cached column in place rather than concatenating them
+        avg_price = (sum(bid_prices) + sum(ask_prices)) / sample_size
+        sides = [side for side in (bid_prices, ask_prices) if side]
 
         return {
             "asset": asset,
             "price": round(avg_price, 2),
             "source": "intent_pool",
-            "sample_size": len(prices),
-            "min_price": min(prices),
-            "max_price": max(prices),
-            "timestamp": int(datetime.now().timestamp())
+            "sample_size": sample_size,
+            "min_price": min(min(side) for side in sides),
+            "max_price": max(max(side) for side in sides),
+            "timestamp": _now_ts()
         }
 
     def _calculate_volatility(
@@ -220,20 +303,26 @@ IMPORTANT: Always return valid JSON. No markdown, no code blocks, just pure JSON
         - Average true range (ATR)
         - Bollinger band width
 
-        For now, returns mock volatility based on asset
+        Uses the price history in context.config["price_history"][asset]
+        when one is supplied; otherwise returns mock volatility based on asset
         """
         asset = tool_input["asset"]
         period = tool_input.get("period", "24h")
 
-        # Mock volatility data
-        base_volatility = {
-            "BTC": 2.5,
-            "ETH": 3.5,
-            "USDC": 0.1,
-            "USD": 0.0
-        }
+        history = context.config.get("price_history", {}).get(asset)
+        if history and len(history) >= 3:
+            volatility, band_width = _volatility_stats(history)
+            return {
+                "asset": asset,
+                "period": period,
+                "volatility_pct": round(volatility, 2),
+                "bollinger_width_pct": round(band_width, 2),
+                "level": "low" if volatility < 2 else "medium" if volatility < 5 else "high",
+                "source": "price_history",
+                "timestamp": _now_ts()
+            }
 
-        volatility = base_volatility.get(asset, 5.0)
+        volatility = BASE_VOLATILITY.get(asset, 5.0)
 
         # Add some randomness
         volatility += random.uniform(-0.5, 0.5)
@@ -243,7 +332,7 @@ IMPORTANT: Always return valid JSON. No markdown, no code blocks, just pure JSON
             "period": period,
             "volatility_pct": round(volatility, 2),
             "level": "low" if volatility < 2 else "medium" if volatility < 5 else "high",
-            "timestamp": int(datetime.now().timestamp())
+            "timestamp": _now_ts()
         }
 
     def _get_market_depth(
@@ -263,34 +352,51 @@ IMPORTANT: Always return valid JSON. No markdown, no code blocks, just pure JSON
         """
         asset = tool_input["asset"]
 
-        # Count active intents by type
-        bids = [i for i in context.available_intents if i.asset == asset and i.intent_type == "bid" and i.is_active]
-        asks = [i for i in context.available_intents if i.asset == asset and i.intent_type == "ask" and i.is_active]
-
-        bid_volume = sum([i.quantity for i in bids])
-        ask_volume = sum([i.quantity for i in asks])
-
-        # Calculate spread
-        if bids and asks:
-            best_bid = max([i.price for i in bids])
-            best_ask = min([i.price for i in asks])
+        # Aggregate the active bid and ask columns
+        bid_prices, bid_quantities = context.intent_columns("bid", asset)
+        ask_prices, ask_quantities = context.intent_columns("ask", asset)
+        bid_count = len(bid_prices)
+        ask_count = len(ask_prices)
+        bid_volume = sum(bid_quantities)
+        ask_volume = sum(ask_quantities)
+
+        # Calculate spread; with one side of the pool empty, estimate it from
+        # recent OHLC bars (open, high, low, close) when the caller supplies them
+        if bid_count and ask_count:
+            spread_source = "intent_pool"
+            best_bid = max(bid_prices)
+            best_ask = min(ask_prices)
             spread_pct = ((best_ask - best_bid) / best_ask) * 100
         else:
             best_bid = 0
             best_ask = 0
             spread_pct = 0
+            spread_source = "none"
+            bars = context.config.get("ohlc_bars", {}).get(asset)
+            if bars and len(bars) >= 2:
+                recent = bars[-SPREAD_ESTIMATE_BARS:]
+                spread_pct = _estimate_spread_cs(
+                    [bar[1] for bar in recent],
+                    [bar[2] for bar in recent]
+                ) * 100
+                spread_source = "ohlc_estimate"
+
+        # Saturates at 10 resting intents
+        depth = bid_count + ask_count
+        liquidity_score = 1.0 if depth >= 10 else depth * 0.1
 
         return {
             "asset": asset,
-            "bid_count": len(bids),
-            "ask_count": len(asks),
+            "bid_count": bid_count,
+            "ask_count": ask_count,
             "bid_volume": round(bid_volume, 4),
             "ask_volume": round(ask_volume, 4),
             "best_bid": best_bid,
             "best_ask": best_ask,
             "spread_pct": round(spread_pct, 2),
-            "liquidity_score": min(1.0, (len(bids) + len(asks)) / 10),
-            "timestamp": int(datetime.now().timestamp())
+            "spread_source": spread_source,
+            "liquidity_score": liquidity_score,
+            "timestamp": _now_ts()
         }
 
     async def run(self, context: AgentContext) -> AgentResult:
@@ -401,7 +507,7 @@ INPUT INTENT:
 
 MARKET CONTEXT:
 - Active intents in pool: {len(context.available_intents)}
-- Intent pool by asset: {self._count_by_asset(context.available_intents)}
+- Intent pool by asset: {context.asset_counts()}
 """
 
         if previous_matches and previous_matches.output.get("matches"):
@@ -418,24 +524,16 @@ Focus on: price fairness, market liquidity, volatility risk, and settlement feas
 
         return prompt
 
-    def _count_by_asset(self, intents: List) -> Dict[str, int]:
-        """Count intents by asset"""
-        counts = {}
-        for intent in intents:
-            if intent.is_active:
-                counts[intent.asset] = counts.get(intent.asset, 0) + 1
-        return counts
-
     def _format_tool_results(self, tool_results: List[Dict[str, Any]]) -> str:
-        """Format tool results for continuation"""
-        results_str = "Market data gathered:\n"
+        """Format tool results for continuation as compact JSON lines"""
+        parts = ["Market data gathered:\n"]
         for result in tool_results:
             if result["success"]:
-                results_str += f"- {result['tool_name']}: {json.dumps(result['result'], indent=2)}\n"
+                parts.append(f"- {result['tool_name']}: {orjson.dumps(result['result']).decode()}\n")
             else:
-                results_str += f"- {result['tool_name']}: Error - {result['error']}\n"
-        results_str += "\nNow provide the final JSON analysis with your assessment."
-        return results_str
+                parts.append(f"- {result['tool_name']}: Error - {result['error']}\n")
+        parts.append("\nNow provide the final JSON analysis with your assessment.")
+        return "".join(parts)
 
 
 # Testing
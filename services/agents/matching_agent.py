@@ -201,15 +201,15 @@ IMPORTANT: Always return valid JSON. No markdown, no code blocks, just pure JSON
         opposite_type = "ask" if input_type == "bid" else "bid"
 
         # Filter from context
-        compatible = []
-        for intent in context.available_intents:
-            if intent.intent_type == opposite_type and intent.asset == input_asset and intent.is_active:
-                compatible.append({
-                    "intent_id": intent.intent_id,
-                    "price": intent.price,
-                    "quantity": intent.quantity,
-                    "timestamp": intent.timestamp
-                })
+        compatible = [
+            {
+                "intent_id": intent.intent_id,
+                "price": intent.price,
+                "quantity": intent.quantity,
+                "timestamp": intent.timestamp
+            }
+            for intent in context.active_intents(opposite_type, input_asset)
+        ]
 
         return {
             "compatible_count": len(compatible),
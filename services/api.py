@@ -2,11 +2,14 @@
 FastAPI REST API for Arc Coordination System
 Provides endpoints for intent submission, querying, matching, and settlement
 """
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
+import hashlib
+import json
 import os
 from web3 import Web3
 from eth_account import Account
@@ -226,7 +229,7 @@ async def list_intents(
 
 
 @app.get("/intents/{intent_id}", response_model=dict)
-async def get_intent(intent_id: str):
+async def get_intent(intent_id: str, request: Request):
     """Get specific intent by ID"""
     intents = indexer.query_intents()
     intent = next((i for i in intents if i.intent_id == intent_id), None)
@@ -234,7 +237,7 @@ async def get_intent(intent_id: str):
     if not intent:
         raise HTTPException(status_code=404, detail="Intent not found")
 
-    return {
+    return _etag_response(request, {
         "intent_id": intent.intent_id,
         "intent_hash": intent.intent_hash,
         "actor": intent.actor,
@@ -243,7 +246,7 @@ async def get_intent(intent_id: str):
         "settlement_asset": intent.settlement_asset,
         "is_active": intent.is_active,
         "is_matched": intent.is_matched
-    }
+    })
 
 
 @app.post("/intents/{intent_id}/cancel")
@@ -306,7 +309,7 @@ async def list_matches(
 
 
 @app.get("/matches/{match_id}", response_model=dict)
-async def get_match(match_id: str):
+async def get_match(match_id: str, request: Request):
     """Get specific match by ID"""
     matches = indexer.query_matches()
     match = next((m for m in matches if m.match_id == match_id), None)
@@ -314,7 +317,7 @@ async def get_match(match_id: str):
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
 
-    return {
+    return _etag_response(request, {
         "match_id": match.match_id,
         "bid_intent_id": match.bid_intent_id,
         "ask_intent_id": match.ask_intent_id,
@@ -324,7 +327,7 @@ async def get_match(match_id: str):
         "created_at": match.created_at,
         "settle_by": match.settle_by,
         "status": match.status
-    }
+    })
 
 
 # Order book endpoint
@@ -397,6 +400,18 @@ async def register_mandate(
     return mandate
 
 
+def _etag_response(request: Request, body: dict) -> Response:
+    """Return body with a content-addressed ETag, or 304 if the client has it"""
+    etag = '"' + hashlib.sha256(
+        json.dumps(body, sort_keys=True).encode()
+    ).hexdigest()[:32] + '"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return JSONResponse(content=body, headers={"ETag": etag})
+
+
 def _get_intent_registry_abi():
     """Get IntentRegistry contract ABI"""
     return [
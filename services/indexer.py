@@ -7,7 +7,7 @@ from typing import Dict, List, Optional
 from web3 import Web3
 from web3.contract import Contract
 from loguru import logger
-from sqlalchemy import create_engine, Column, String, Integer, Boolean, Text
+from sqlalchemy import create_engine, event, Column, String, Integer, Boolean, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -50,6 +50,24 @@ class MatchDB(Base):
     ap2_proof_hash = Column(String, nullable=True)
 
 
+def enable_sqlite_fast_writes(engine) -> None:
+    """
+    Apply write-friendly SQLite pragmas to every new connection of engine
+
+    Intended for dev/test data loading: WAL journaling with
+    synchronous=NORMAL skips the fsync on each commit, so the last
+    transactions may be lost on power failure (but not on a process crash).
+    """
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+
 class ArcIndexer:
     """
     Arc blockchain event indexer for Intent Registry and Auction Escrow
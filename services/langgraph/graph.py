@@ -251,6 +251,7 @@ class CoordinationGraph:
         logger.info("→ Executing liquidity_agent")
 
         context = self._build_context(state)
+        context.previous_results["matching_agent"] = self._get_agent_result("matching_result", state)
         context.previous_results["market_agent"] = self._get_agent_result("market_result", state)
 
         result = await self.liquidity_agent.run(context)
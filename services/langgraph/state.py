@@ -13,6 +13,7 @@ from typing import TypedDict, List, Dict, Any, Optional, Annotated
 from dataclasses import dataclass, field
 from datetime import datetime
 import operator
+import sys
 
 
 # Type definitions for state channels
@@ -28,7 +29,7 @@ def merge_dicts(left: Dict, right: Dict) -> Dict:
     return result
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentData:
     """
     Intent information passed through the workflow
@@ -47,6 +48,16 @@ class IntentData:
     is_active: bool
     payload: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Lowercase actor address, normalized once for case-insensitive comparisons
+    actor_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.actor_lc = self.actor.lower()
+        # Small fixed symbol universe: intern so asset/type-keyed lookups and
+        # comparisons hit the identity fast path
+        self.intent_type = sys.intern(self.intent_type)
+        self.asset = sys.intern(self.asset)
+        self.settlement_asset = sys.intern(self.settlement_asset)
 
     @classmethod
     def from_db(cls, intent_db: Any) -> 'IntentData':
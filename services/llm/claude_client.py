@@ -8,10 +8,17 @@ Supports tool use, structured outputs, and streaming.
 import os
 import json
 import logging
-from typing import List, Dict, Any, Optional, Union
-from anthropic import Anthropic, AsyncAnthropic
+from typing import List, Dict, Any, Optional, Union, Sequence
+import httpx
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
 
+try:
+    import h2  # noqa: F401 - httpx's optional HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Load environment variables
 load_dotenv('config/.env')
 
@@ -56,15 +63,37 @@ class ClaudeClient:
 
         # Initialize clients
         self.client = Anthropic(api_key=self.api_key) if self.api_key else None
-        self.async_client = AsyncAnthropic(api_key=self.api_key) if self.api_key else None
+        self.async_client = AsyncAnthropic(
+            api_key=self.api_key,
+            http_client=self._build_async_http_client()
+        ) if self.api_key else None
 
         logger.info(f"Claude client initialized with model: {model}")
 
+    @staticmethod
+    def _build_async_http_client() -> Optional[httpx.AsyncClient]:
+        """
+        Build the HTTP/2 client used for async calls
+
+        Concurrent agents multiplex their LLM requests as streams over one
+        connection instead of queueing on a per-host HTTP/1.1 pool. The
+        client starts from the SDK's DefaultAsyncHttpxClient so its
+        timeouts, redirect and proxy handling are kept. Returns None (the
+        SDK default client) when h2 is not installed.
+        """
+        if not HTTP2_AVAILABLE:
+            logger.info("h2 not installed; async Claude calls use HTTP/1.1")
+            return None
+        return DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+
     def complete(
         self,
         messages: List[Dict[str, str]],
-        system: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
+        system: Optional[Union[str, List[str]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -72,7 +101,7 @@ class ClaudeClient:
 
         Args:
             messages: List of message dicts with 'role' and 'content'
-            system: System prompt
+            system: System prompt, or [cached prefix, uncached parts...]
             tools: Tool definitions for function calling
             **kwargs: Additional API parameters
 
@@ -91,7 +120,7 @@ class ClaudeClient:
             }
 
             if system:
-                params['system'] = system
+                params['system'] = self._system_blocks(system)
 
             if tools:
                 params['tools'] = tools
@@ -124,8 +153,8 @@ class ClaudeClient:
     async def acomplete(
         self,
         messages: List[Dict[str, str]],
-        system: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
+        system: Optional[Union[str, List[str]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -133,7 +162,7 @@ class ClaudeClient:
 
         Args:
             messages: List of message dicts
-            system: System prompt
+            system: System prompt, or [cached prefix, uncached parts...]
             tools: Tool definitions
             **kwargs: Additional API parameters
 
@@ -152,7 +181,7 @@ class ClaudeClient:
             }
 
             if system:
-                params['system'] = system
+                params['system'] = self._system_blocks(system)
 
             if tools:
                 params['tools'] = tools
@@ -180,6 +209,28 @@ class ClaudeClient:
             logger.error(f"Claude async API error: {e}")
             raise
 
+    @staticmethod
+    def _system_blocks(system: Union[str, List[str]]) -> List[Dict[str, Any]]:
+        """
+        Wrap a system prompt as text blocks, caching only the stable prefix
+
+        Agent system prompts are byte-stable across requests, so the first
+        part is marked ephemeral and Anthropic prompt caching serves repeat
+        calls from cache. Later parts (rolling context such as a history
+        summary) follow uncached so their changes never invalidate the
+        prefix. Empty parts are skipped.
+        """
+        parts = [system] if isinstance(system, str) else system
+        blocks = []
+        for i, text in enumerate(parts):
+            if not text:
+                continue
+            block = {"type": "text", "text": text}
+            if i == 0:
+                block["cache_control"] = {"type": "ephemeral"}
+            blocks.append(block)
+        return blocks
+
     def _extract_content(self, content: List[Any]) -> str:
         """Extract text content from response"""
         text_blocks = [block.text for block in content if hasattr(block, 'text')]
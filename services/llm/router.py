@@ -9,7 +9,7 @@ Intelligently routes requests to Claude or Gemini based on:
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union, Sequence
 from enum import Enum
 
 from .claude_client import ClaudeClient
@@ -18,6 +18,13 @@ from .gemini_client import GeminiClient
 logger = logging.getLogger(__name__)
 
 
+def _system_text(system: Optional[Union[str, List[str]]]) -> Optional[str]:
+    """Join a multi-part system prompt for models without block-level caching"""
+    if system is None or isinstance(system, str):
+        return system
+    return "\n\n".join(part for part in system if part) or None
+
+
 class ModelPreference(Enum):
     """Model preference hints for routing"""
     CLAUDE = "claude"  # Prefer Claude Sonnet 4.5
@@ -52,9 +59,9 @@ class LLMRouter:
     def complete(
         self,
         prompt: str,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[str]]] = None,
         messages: Optional[List[Dict[str, str]]] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         preference: ModelPreference = ModelPreference.AUTO,
         **kwargs
     ) -> Dict[str, Any]:
@@ -63,7 +70,7 @@ class LLMRouter:
 
         Args:
             prompt: User prompt (used if messages not provided)
-            system: System instruction
+            system: System instruction, or [cached prefix, uncached parts...]
             messages: Conversation history (Claude format)
             tools: Tool definitions (triggers Claude)
             preference: Model preference hint
@@ -104,7 +111,7 @@ class LLMRouter:
         self,
         prompt: str,
         messages: Optional[List[Dict[str, str]]],
-        tools: Optional[List[Dict[str, Any]]],
+        tools: Optional[Sequence[Dict[str, Any]]],
         preference: ModelPreference,
         **kwargs
     ) -> str:
@@ -156,9 +163,9 @@ class LLMRouter:
     def _complete_claude(
         self,
         prompt: str,
-        system: Optional[str],
+        system: Optional[Union[str, List[str]]],
         messages: Optional[List[Dict[str, str]]],
-        tools: Optional[List[Dict[str, Any]]],
+        tools: Optional[Sequence[Dict[str, Any]]],
         **kwargs
     ) -> Dict[str, Any]:
         """Complete using Claude"""
@@ -180,7 +187,7 @@ class LLMRouter:
     def _complete_gemini(
         self,
         prompt: str,
-        system: Optional[str],
+        system: Optional[Union[str, List[str]]],
         messages: Optional[List[Dict[str, str]]],
         **kwargs
     ) -> Dict[str, Any]:
@@ -189,12 +196,12 @@ class LLMRouter:
         if messages:
             response = self.gemini.complete_with_history(
                 messages=messages,
-                system_instruction=system
+                system_instruction=_system_text(system)
             )
         else:
             response = self.gemini.complete(
                 prompt=prompt,
-                system_instruction=system,
+                system_instruction=_system_text(system),
                 **kwargs
             )
 
@@ -205,9 +212,9 @@ class LLMRouter:
     async def acomplete(
         self,
         prompt: str,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[str]]] = None,
         messages: Optional[List[Dict[str, str]]] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Dict[str, Any]]] = None,
         preference: ModelPreference = ModelPreference.AUTO,
         **kwargs
     ) -> Dict[str, Any]:
@@ -245,7 +252,7 @@ class LLMRouter:
             else:
                 response = await self.gemini.acomplete(
                     prompt=prompt,
-                    system_instruction=system,
+                    system_instruction=_system_text(system),
                     **kwargs
                 )
                 response["router_model"] = "gemini"
@@ -259,7 +266,7 @@ class LLMRouter:
                 logger.info("Falling back to Gemini")
                 response = await self.gemini.acomplete(
                     prompt=prompt,
-                    system_instruction=system,
+                    system_instruction=_system_text(system),
                     **kwargs
                 )
                 response["router_model"] = "gemini"
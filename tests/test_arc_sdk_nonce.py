@@ -0,0 +1,89 @@
+"""
+Escrow Nonce Tracking Tests
+
+Checks that the SDK's locally tracked nonce is dropped whenever an
+escrow funding attempt fails, so the next transaction refetches the
+pending nonce instead of queueing behind a gap.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sdk import arc_sdk
+from sdk.arc_sdk import ArcSDK
+
+SENDER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+MATCH_ID = "0x" + "11" * 32
+
+
+def make_sdk(pending_nonce: int = 7) -> ArcSDK:
+    """Build an ArcSDK with mocked chain access and no network clients"""
+    sdk = ArcSDK.__new__(ArcSDK)
+    sdk.account = SimpleNamespace(address=SENDER)
+    sdk._private_key = "0x" + "01" * 32
+    sdk._nonce = None
+    sdk._nonce_lock = asyncio.Lock()
+    sdk._chain_id = 31337
+    sdk._fee_cache = {"maxPriorityFeePerGas": 1, "maxFeePerGas": 3}
+    sdk._fee_cache_time = float("inf")
+    sdk.w3 = SimpleNamespace(eth=SimpleNamespace(
+        get_transaction_count=mock.AsyncMock(return_value=pending_nonce),
+        send_raw_transaction=mock.AsyncMock(side_effect=ValueError("rejected")),
+        wait_for_transaction_receipt=mock.AsyncMock()
+    ))
+    sdk._build_fund_escrow_tx = mock.AsyncMock(return_value={"nonce": pending_nonce})
+    return sdk
+
+
+class TestEscrowNonce(unittest.IsolatedAsyncioTestCase):
+    """Nonce reset behaviour of the escrow funding paths"""
+
+    async def test_next_nonce_advances_locally(self):
+        sdk = make_sdk(pending_nonce=7)
+        self.assertEqual(await sdk._next_nonce(), 7)
+        self.assertEqual(await sdk._next_nonce(), 8)
+        sdk.w3.eth.get_transaction_count.assert_awaited_once()
+
+    async def test_failed_send_resets_nonce(self):
+        sdk = make_sdk()
+        with mock.patch.object(arc_sdk, "_get_signer_pool", return_value=None), \
+                mock.patch.object(arc_sdk, "_sign_tx", return_value=b"raw"):
+            with self.assertRaises(ValueError):
+                await sdk.fund_escrow(MATCH_ID, 10)
+        self.assertIsNone(sdk._nonce)
+
+    async def test_failed_build_resets_nonce(self):
+        sdk = make_sdk()
+        sdk._build_fund_escrow_tx.side_effect = ValueError("bad match id")
+        with self.assertRaises(ValueError):
+            await sdk.fund_escrow(MATCH_ID, 10)
+        self.assertIsNone(sdk._nonce)
+        sdk.w3.eth.send_raw_transaction.assert_not_awaited()
+
+    async def test_failed_batch_resets_nonce(self):
+        sdk = make_sdk()
+        sdk._build_fund_escrow_tx.side_effect = ValueError("bad match id")
+        with self.assertRaises(ValueError):
+            await sdk.fund_escrow_batch([MATCH_ID, MATCH_ID], [10, 20])
+        self.assertIsNone(sdk._nonce)
+
+    async def test_fee_error_does_not_reserve_nonce(self):
+        sdk = make_sdk()
+        sdk._fee_cache = None
+        sdk.w3.eth.get_block = mock.AsyncMock(side_effect=ConnectionError("rpc down"))
+        sdk.w3.eth.max_priority_fee = asyncio.sleep(0, result=1)
+        with self.assertRaises(ConnectionError):
+            await sdk.fund_escrow(MATCH_ID, 10)
+        sdk.w3.eth.get_transaction_count.assert_not_awaited()
+        self.assertIsNone(sdk._nonce)
+
+
+if __name__ == "__main__":
+    unittest.main()
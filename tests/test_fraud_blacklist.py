@@ -0,0 +1,80 @@
+"""
+Fraud Blacklist Tests
+
+Checks the Bloom filter prefilter in front of the blacklist: it must
+never reject a blacklisted address, and the full lookup must stay
+exact and case-insensitive.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.agents import fraud_agent
+from services.agents.fraud_agent import FraudAgent, _BloomFilter, BLOOM_FALSE_POSITIVE_RATE
+
+
+def random_addresses(count: int, seed: int):
+    """Deterministic lowercase 20-byte hex addresses"""
+    rng = random.Random(seed)
+    return ["0x" + rng.randbytes(20).hex() for _ in range(count)]
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Membership guarantees of _BloomFilter"""
+
+    def test_no_false_negatives(self):
+        members = random_addresses(5000, seed=1) + list(fraud_agent._BLACKLIST_REASONS)
+        bloom = _BloomFilter(members)
+        missing = [address for address in members if address not in bloom]
+        self.assertEqual(missing, [])
+
+    def test_false_positive_rate_near_target(self):
+        bloom = _BloomFilter(random_addresses(5000, seed=2))
+        probes = random_addresses(20000, seed=3)
+        false_positives = sum(address in bloom for address in probes)
+        # Generous bound so the check is not flaky across hash seeds
+        self.assertLess(false_positives / len(probes), 3 * BLOOM_FALSE_POSITIVE_RATE)
+
+    def test_empty_filter_rejects_everything(self):
+        bloom = _BloomFilter([])
+        self.assertFalse(any(address in bloom for address in random_addresses(100, seed=4)))
+
+
+class TestCheckBlacklist(unittest.TestCase):
+    """FraudAgent._check_blacklist on top of the Bloom prefilter"""
+
+    def setUp(self):
+        self._saved = fraud_agent._BLACKLIST
+        # The blacklist check uses no agent state, so skip LLM router setup
+        self.agent = FraudAgent.__new__(FraudAgent)
+
+    def tearDown(self):
+        fraud_agent._BLACKLIST = self._saved
+
+    def test_every_default_entry_is_flagged(self):
+        for address, reason in fraud_agent._BLACKLIST_REASONS.items():
+            result = self.agent._check_blacklist({"actor_address": address})
+            self.assertTrue(result["is_blacklisted"], address)
+            self.assertEqual(result["reason"], reason)
+            self.assertEqual(result["risk_level"], "critical")
+
+    def test_reloaded_entries_match_case_insensitively(self):
+        addresses = random_addresses(1000, seed=5)
+        FraudAgent._reload_blacklist({address.upper(): "test" for address in addresses})
+        for address in addresses:
+            self.assertTrue(self.agent._check_blacklist({"actor_address": address})["is_blacklisted"])
+
+    def test_clean_address_is_not_flagged(self):
+        for address in random_addresses(1000, seed=6):
+            result = self.agent._check_blacklist({"actor_address": address})
+            self.assertFalse(result["is_blacklisted"])
+            self.assertIsNone(result["reason"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Market Statistics Tests
+
+Checks the market agent's numeric kernels against reference
+implementations and hand-computed fixtures.
+"""
+
+import math
+import os
+import random
+import statistics
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.agents.market_agent import _estimate_spread_cs, _volatility_stats
+
+
+def returns_of(prices):
+    """Simple period returns of a price series"""
+    return [current / previous - 1.0 for previous, current in zip(prices, prices[1:])]
+
+
+class TestVolatilityStats(unittest.TestCase):
+    """Single-pass Welford kernel behind _calculate_volatility"""
+
+    def assert_matches_reference(self, prices):
+        volatility, band_width = _volatility_stats(prices)
+
+        returns = returns_of(prices)
+        # The kernel reports sample statistics: pvariance scaled by n / (n - 1)
+        ret_variance = statistics.pvariance(returns) * len(returns) / (len(returns) - 1)
+        price_variance = statistics.pvariance(prices) * len(prices) / (len(prices) - 1)
+
+        self.assertTrue(math.isclose(volatility, math.sqrt(ret_variance) * 100, rel_tol=1e-9))
+        self.assertTrue(math.isclose(
+            band_width, 4 * math.sqrt(price_variance) / statistics.fmean(prices) * 100, rel_tol=1e-9
+        ))
+        self.assertTrue(math.isclose(volatility, statistics.stdev(returns) * 100, rel_tol=1e-9))
+
+    def test_matches_statistics_on_small_series(self):
+        self.assert_matches_reference([100.0, 101.0, 99.5, 102.0, 103.2, 101.1, 104.0])
+
+    def test_matches_statistics_on_random_walk(self):
+        rng = random.Random(7)
+        prices = [10000.0]
+        for _ in range(2000):
+            prices.append(prices[-1] * math.exp(rng.gauss(0, 0.01)))
+        self.assert_matches_reference(prices)
+
+    def test_stable_for_large_offset_prices(self):
+        # Naive sum-of-squares loses all precision here; Welford does not
+        prices = [1e9 + delta for delta in (0.0, 1.0, -1.0, 2.0, -2.0, 0.5)]
+        self.assert_matches_reference(prices)
+
+    def test_constant_prices_have_zero_volatility(self):
+        self.assertEqual(_volatility_stats([50.0] * 10), (0.0, 0.0))
+
+    def test_minimum_history(self):
+        self.assert_matches_reference([100.0, 110.0, 99.0])
+
+
+class TestSpreadEstimate(unittest.TestCase):
+    """Corwin-Schultz estimator behind the one-sided depth fallback"""
+
+    def test_identical_bars_fixture(self):
+        # With equal bars, beta = 2*ln(H/L)^2 and gamma = ln(H/L)^2 reduce
+        # alpha to ln(H/L), so S = 2(H/L - 1)/(1 + H/L) = 0.02 for 101/99
+        self.assertAlmostEqual(_estimate_spread_cs([101.0, 101.0], [99.0, 99.0]), 0.02, places=12)
+        self.assertAlmostEqual(_estimate_spread_cs([101.0] * 5, [99.0] * 5), 0.02, places=12)
+
+    def test_negative_pair_estimates_count_as_zero(self):
+        # The second bar gaps far above the first: alpha < 0 for that pair
+        estimate = _estimate_spread_cs([101.0, 111.0, 111.0], [99.0, 109.0, 109.0])
+        pair_estimate = _estimate_spread_cs([111.0, 111.0], [109.0, 109.0])
+        self.assertEqual(_estimate_spread_cs([101.0, 111.0], [99.0, 109.0]), 0.0)
+        self.assertAlmostEqual(estimate, pair_estimate / 2, places=12)
+
+    def test_recovers_simulated_spread(self):
+        rng = random.Random(11)
+        half_spread = 0.005
+        mid = 100.0
+        highs, lows = [], []
+        for _ in range(300):
+            path = []
+            for _ in range(100):
+                mid *= math.exp(rng.gauss(0, 0.0005))
+                path.append(mid)
+            highs.append(max(path) * (1 + half_spread))
+            lows.append(min(path) * (1 - half_spread))
+        self.assertAlmostEqual(_estimate_spread_cs(highs, lows), 0.01, delta=0.001)
+
+    def test_needs_two_bars(self):
+        self.assertEqual(_estimate_spread_cs([101.0], [99.0]), 0.0)
+        self.assertEqual(_estimate_spread_cs([], []), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()